@@ -5,7 +5,7 @@ from keras.saving import load_model
 
 from .cuts import Cut, CutAndCount, CutLayer
 from .networks import SimpleCNN, SimpleGNN, SimpleMLP
-from .trees import GradientBoostedDecisionTree
+from .trees import GradientBoostedDecisionTree, HistGradientBoostedDecisionTree
 
 
 def load_approach(filepath):
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import keras
+import numba as nb
+import numpy as np
 from keras import ops
 
-from hml.operations import ops_histogram_fixed_width, ops_unique
+from hml.operations import ops_histogram_fixed_width
 
-from .cut_layer import CutLayer
+from .cut_layer import CutLayer, cut_mask
 
 
 @keras.saving.register_keras_serializable()
@@ -37,150 +39,141 @@ class CutAndCount(keras.Model):
         return {m.name: m.result() for m in self.metrics}
 
     def call(self, x, y=None):
-        if self.topology == "parallel":
+        if y is None and self.topology in ["parallel", "sequential"]:
+            # Once fitted, both topologies keep samples passing all cuts
+            y_pred = self.apply_cuts(x)
+        elif self.topology == "parallel":
             y_pred = ops.squeeze(self.parallel_call(x, y))  # (N,)
         elif self.topology == "sequential":
             y_pred = ops.squeeze(self.sequential_call(x, y))  # (N,)
         else:
             raise NotImplementedError()
 
-        return ops.one_hot(ops.cast(y_pred, "int32"), num_classes=2)
+        # y_pred is already 0 or 1, so the two classes are just its complement
+        return ops.stack([1 - y_pred, y_pred], -1)
 
     def parallel_call(self, x, y=None):
-        y_preds = []
-
-        for cut_layer in self.cut_layers:
-            ix = ops.take(x, cut_layer.feature_id, axis=-1)
-
-            if y is not None:
-                cut_left, cut_right, case = self.find_best_cut(ix, y)
+        if y is not None:
+            # Cuts of a parallel topology are independent, so search them for
+            # all features at once
+            feature_ids = [i.feature_id for i in self.cut_layers]
+            x_features = ops.take(x, feature_ids, axis=-1)
+            cuts = self._find_best_cuts(x_features, self._to_labels(y))
+            for cut_layer, (cut_left, cut_right, case) in zip(self.cut_layers, cuts):
                 cut_layer._cut_left.assign(cut_left)
                 cut_layer._cut_right.assign(cut_right)
                 cut_layer._case.assign(case)
 
-            y_pred = cut_layer(ix)
-            y_preds.append(y_pred)
-
-        return keras.layers.Multiply()(y_preds)
+        return self.apply_cuts(x)
 
     def sequential_call(self, x, y=None, show_cut_mark=False):
-        y_pred = ops.ones(ops.shape(x)[0])
-        mask = y_pred
+        # Accumulate the selection as a boolean mask and cast it only once
+        y_pred = ops.ones(ops.shape(x)[0], "bool")
+        mask = ops.ones(ops.shape(x)[0])
         for cut_layer in self.cut_layers:
             ix = ops.take(x, cut_layer.feature_id, axis=-1)
 
             if y is not None:
-                masked_x = ops.take(ix, ops.squeeze(ops.where(mask >= 0), 0))
-                masked_y = ops.take(
-                    y, ops.squeeze(ops.where(mask >= 0), 0), 0
-                )  # should keep y as original
+                selected = ops.squeeze(ops.where(mask >= 0), 0)
+                masked_x = ops.take(ix, selected)
+                masked_y = ops.take(y, selected, 0)  # should keep y as original
                 cut_left, cut_right, case = self.find_best_cut(masked_x, masked_y)
                 cut_layer._cut_left.assign(cut_left)
                 cut_layer._cut_right.assign(cut_right)
                 cut_layer._case.assign(case)
 
             mask = cut_layer.apply_cut(ix, -1)
-            y_pred = ops.logical_and(y_pred, ops.where(mask < 0, 0.0, 1.0))
-            y_pred = ops.cast(y_pred, "float32")
-
-        return y_pred
+            y_pred = ops.logical_and(y_pred, mask >= 0)
+
+        return ops.cast(y_pred, "float32")
+
+    def make_train_function(self, force=False):
+        # Searching cuts leaves the graph, so training always runs eagerly.
+        # Applying the fitted cuts is a single fused mask over all features,
+        # so predicting and evaluating follow the compile arguments, where
+        # jit_compile="auto" is resolved by Keras.
+        run_eagerly = self.run_eagerly
+        self.run_eagerly = True
+        try:
+            return super().make_train_function(force)
+        finally:
+            self.run_eagerly = run_eagerly
+
+    def apply_cuts(self, x):
+        # Gather the cuts of all layers to apply them on (N, F) at once
+        feature_ids = [i.feature_id for i in self.cut_layers]
+        cut_left = ops.stack([i._cut_left.value for i in self.cut_layers])
+        cut_right = ops.stack([i._cut_right.value for i in self.cut_layers])
+        case = ops.stack([i._case.value for i in self.cut_layers])
+
+        x = ops.take(ops.cast(x, "float32"), feature_ids, axis=-1)
+        mask = cut_mask(x, cut_left, cut_right, case)
+
+        return ops.cast(ops.all(mask, -1), "float32")
 
     def find_best_cut(self, x, y):
+        x = ops.expand_dims(x, -1)
+        return self._find_best_cuts(x, self._to_labels(y))[0]
+
+    def _to_labels(self, y):
         if ops.ndim(y) == 2:
             if ops.ndim(ops.squeeze(y)) == 2:
-                iy = ops.argmax(y, -1)
-            else:
-                iy = ops.squeeze(y)
-        else:
-            iy = y
+                return ops.argmax(y, -1)
+            return ops.squeeze(y)
+        return y
 
-        x_min = ops.min(x)
-        x_max = ops.max(x)
-        bin_edges = ops.linspace(x_min, x_max, self.n_bins + 1)
+    def _find_best_cuts(self, x, iy):
+        # I: x (N, F), iy (N,)
+        # O: F tuples of (lower, upper, case)
+        x_min = ops.min(x, 0)
+        x_max = ops.max(x, 0)
+        bin_edges = ops.linspace(x_min, x_max, self.n_bins + 1, axis=-1)
 
         is_bkg = ops.squeeze(ops.where(ops.equal(iy, 0)), 0)
         is_sig = ops.squeeze(ops.where(ops.equal(iy, 1)), 0)
 
-        x0 = ops.take(x, is_bkg)
-        x1 = ops.take(x, is_sig)
+        x0 = ops.take(x, is_bkg, 0)
+        x1 = ops.take(x, is_sig, 0)
 
+        # (F, n_bins) histograms of all features from one bincount per class
         hist0 = ops_histogram_fixed_width(x0, [x_min, x_max], self.n_bins)
         hist1 = ops_histogram_fixed_width(x1, [x_min, x_max], self.n_bins)
 
-        curr_case0 = ops.greater(hist0, hist1)[:-1]  # type: ignore
-        next_case0 = ops.greater(hist0, hist1)[1:]  # type: ignore
+        bkg_dominates = ops.greater(hist0, hist1)
+        sig_dominates = ops.greater(hist1, hist0)
+
+        curr_case0 = bkg_dominates[:, :-1]  # type: ignore
+        next_case0 = bkg_dominates[:, 1:]  # type: ignore
         is_on_boundary0 = ops.logical_xor(curr_case0, next_case0)
-        is_not_empty0 = hist0[:-1] > 0  # type: ignore
+        is_not_empty0 = hist0[:, :-1] > 0  # type: ignore
         is_candidate0 = ops.logical_and(is_on_boundary0, is_not_empty0)
-        candidate_indices0 = ops.add(ops.squeeze(ops.where(is_candidate0), 0), 1)
-        candidates0 = ops.take(bin_edges, candidate_indices0)
 
-        curr_case1 = ops.greater(hist1, hist0)[:-1]  # type: ignore
-        next_case1 = ops.greater(hist1, hist0)[1:]  # type: ignore
+        curr_case1 = sig_dominates[:, :-1]  # type: ignore
+        next_case1 = sig_dominates[:, 1:]  # type: ignore
         is_on_boundary1 = ops.logical_xor(curr_case1, next_case1)
-        is_not_empty1 = hist1[:-1] > 0  # type: ignore
+        is_not_empty1 = hist1[:, :-1] > 0  # type: ignore
         is_candidate1 = ops.logical_and(is_on_boundary1, is_not_empty1)
-        candidate_indices1 = ops.add(ops.squeeze(ops.where(is_candidate1), 0), 1)
-        candidates1 = ops.take(bin_edges, candidate_indices1)
-
-        candidates = ops_unique(ops.concatenate([candidates0, candidates1], 0))
-        candidates = ops.cond(
-            ops.equal(ops.shape(candidates)[0], 1),
-            lambda: ops.append(candidates, x_max),
-            lambda: candidates,
-        )
-        i, j = ops.meshgrid(candidates, candidates)  # type: ignore
-        i, j = i[i < j], j[i < j]
-        candidate_pairs = ops.stack([i, j], 1)
-        losses_and_cases = ops.vectorized_map(
-            lambda pair: self._get_min_loss_and_case(x, y, pair, self.compute_loss),
-            candidate_pairs,
+
+        # Merge the masks rather than the gathered edges: the indices of the
+        # union are already sorted and unique
+        is_candidate = ops.logical_or(is_candidate0, is_candidate1)
+
+        # Sort each class once, so counting samples on either side of a cut
+        # is a binary search instead of a pass over all samples
+        x0 = ops.sort(ops.transpose(x0))  # (F, N0)
+        x1 = ops.sort(ops.transpose(x1))  # (F, N1)
+
+        # The number of candidates differs between features, so the rest of
+        # the search runs compiled over the features
+        lower, upper, case = find_best_cuts(
+            ops.convert_to_numpy(is_candidate),
+            ops.convert_to_numpy(bin_edges),
+            ops.convert_to_numpy(x_max),
+            ops.convert_to_numpy(x0),
+            ops.convert_to_numpy(x1),
         )
-        min_index = ops.argmin(ops.take(losses_and_cases, 0, 1))
-        # min_loss = losses_and_cases[min_index, 0]  # type: ignore
-        min_case = losses_and_cases[min_index, 1]  # type: ignore
-
-        lower = candidate_pairs[min_index, 0]  # type: ignore
-        upper = candidate_pairs[min_index, 1]  # type: ignore
-
-        return lower, upper, min_case
-
-    def _get_min_loss_and_case(self, x, y, candidate_pair, loss_fn):  # pragma: no cover
-        # I: (n_samples,), (n_samples, ?), (2,)
-        cut0 = candidate_pair[0]
-        cut1 = candidate_pair[1]
-
-        # For each pair, calculate the loss of the four cases
-        # Case 0: signal on the left
-        on_left = ops.less_equal(x, cut0)  # (n_samples,)
-        y_pred0 = ops.where(on_left, 1.0, 0.0)  # (n_samples,)
-        y_pred0 = ops.one_hot(ops.cast(y_pred0, "int32"), num_classes=2)
-        loss0 = loss_fn(y=y, y_pred=y_pred0)
-
-        # Case 1: signal on the right
-        on_right = ops.greater_equal(x, cut0)
-        y_pred1 = ops.where(on_right, 1.0, 0.0)
-        y_pred1 = ops.one_hot(ops.cast(y_pred1, "int32"), num_classes=2)
-        loss1 = loss_fn(y=y, y_pred=y_pred1)
-
-        # Case 2: signal in the middle
-        in_middle = ops.logical_and(x >= cut0, x <= cut1)
-        y_pred2 = ops.where(in_middle, 1.0, 0.0)
-        y_pred2 = ops.one_hot(ops.cast(y_pred2, "int32"), num_classes=2)
-        loss2 = loss_fn(y=y, y_pred=y_pred2)
-
-        # Case 3: signal on both sides
-        on_both_sides = ops.logical_or(x <= cut0, x >= cut1)
-        y_pred3 = ops.where(on_both_sides, 1.0, 0.0)
-        y_pred3 = ops.one_hot(ops.cast(y_pred3, "int32"), num_classes=2)
-        loss3 = loss_fn(y=y, y_pred=y_pred3)
-
-        # The cases 0, 1, 2, 3 are corresponding to the four possible cases:
-        # left, right, middle, both sides
-        min_case = ops.argmin([loss0, loss1, loss2, loss3])
-        min_loss = ops.min([loss0, loss1, loss2, loss3])
-
-        return ops.append(min_loss, min_case)  # (2,)
+
+        return [(lower[i], upper[i], float(case[i])) for i in range(len(case))]
 
     def get_config(self):
         config = super().get_config()
@@ -193,3 +186,130 @@ class CutAndCount(keras.Model):
         )
 
         return config
+
+
+@nb.njit(parallel=True, cache=True)
+def find_best_cuts(is_candidate, bin_edges, x_max, x0, x1):  # pragma: no cover
+    """Find the best cuts of each feature from its candidate bin edges.
+
+    Parameters
+    ----------
+    is_candidate: array, shape (n_features, n_bins - 1)
+        Whether each inner bin edge is a candidate cut.
+    bin_edges: array, shape (n_features, n_bins + 1)
+        Bin edges of each feature.
+    x_max: array, shape (n_features,)
+        Maximum of each feature.
+    x0, x1: array, shape (n_features, n_bkg) and (n_features, n_sig)
+        Background and signal values of each feature, sorted along each row.
+
+    Return
+    ------
+    lower, upper: array, shape (n_features,)
+        The two cuts of each feature.
+    case: array, shape (n_features,)
+        The case of the signal region of each feature.
+    """
+    n_features = len(x_max)
+    n_bkg, n_sig = x0.shape[1], x1.shape[1]
+    lower = np.zeros(n_features, bin_edges.dtype)
+    upper = np.zeros(n_features, bin_edges.dtype)
+    case = np.zeros(n_features, np.int64)
+
+    for i in nb.prange(n_features):
+        candidates = bin_edges[i][np.nonzero(is_candidate[i])[0] + 1]
+
+        # Without any boundary fall back to a cut at 0, and pair a single
+        # candidate with the maximum
+        if len(candidates) == 0:
+            candidates = np.zeros(1, bin_edges.dtype)
+        if len(candidates) == 1:
+            candidates = np.append(candidates, bin_edges.dtype.type(x_max[i]))
+
+        # Count each class on both sides of every candidate once. The selected
+        # samples of the four cases (left, right, middle, both sides) of all
+        # pairs then follow from these counts without another pass over x.
+        bkg_left = np.searchsorted(x0[i], candidates, side="right")
+        bkg_right = n_bkg - np.searchsorted(x0[i], candidates, side="left")
+        sig_left = np.searchsorted(x1[i], candidates, side="right")
+        sig_right = n_sig - np.searchsorted(x1[i], candidates, side="left")
+        lower_index, upper_index, case[i] = find_best_pair(
+            bkg_left, bkg_right, sig_left, sig_right, n_bkg, n_sig
+        )
+        lower[i] = candidates[lower_index]
+        upper[i] = candidates[upper_index]
+
+    return lower, upper, case
+
+
+@nb.njit(cache=True)
+def find_best_pair(
+    bkg_left, bkg_right, sig_left, sig_right, n_bkg, n_sig
+):  # pragma: no cover
+    """Find the candidate pair and case with the fewest misclassified samples.
+
+    Parameters
+    ----------
+    bkg_left, bkg_right: array, shape (n_candidates,)
+        Number of background samples <= and >= each sorted candidate.
+    sig_left, sig_right: array, shape (n_candidates,)
+        Number of signal samples <= and >= each sorted candidate.
+    n_bkg, n_sig: int
+        Total number of background and signal samples.
+
+    Return
+    ------
+    lower_index, upper_index, case: int
+        Indices of the two cuts in the candidates and the case of the signal
+        region: 0 left, 1 right, 2 middle, 3 both sides.
+    """
+    bkg_left, bkg_right = bkg_left.astype(np.int64), bkg_right.astype(np.int64)
+    sig_left, sig_right = sig_left.astype(np.int64), sig_right.astype(np.int64)
+    n_candidates = len(bkg_left)
+
+    # The errors (selected background plus rejected signal) of every case are
+    # a term of the lower cut plus a term of the upper cut. Keeping the
+    # running minimum of the lower terms scans all pairs in a single pass.
+    lower_errors = np.full(4, n_bkg + n_sig + 1)
+    lower_index = np.zeros(4, np.int64)
+    best_errors = n_bkg + n_sig + 1
+    best_lower, best_upper, best_case = 0, 0, 0
+
+    for upper in range(1, n_candidates):
+        lower = upper - 1
+        lower_terms = (
+            bkg_left[lower] - sig_left[lower] + n_sig,
+            bkg_right[lower] - sig_right[lower] + n_sig,
+            bkg_right[lower] - sig_right[lower],
+            bkg_left[lower] - sig_left[lower],
+        )
+        upper_terms = (
+            0,
+            0,
+            bkg_left[upper] - sig_left[upper] - n_bkg + 2 * n_sig,
+            bkg_right[upper] - sig_right[upper] + n_sig,
+        )
+
+        # Ties keep the smallest lower index, then the first case, and then
+        # the first upper index, as a scan over all pairs in order would
+        for case in range(4):
+            if lower_terms[case] < lower_errors[case]:
+                lower_errors[case] = lower_terms[case]
+                lower_index[case] = lower
+
+        row_errors = n_bkg + n_sig + 1
+        row_lower, row_case = 0, 0
+        for case in range(4):
+            errors = lower_errors[case] + upper_terms[case]
+            if errors < row_errors or (
+                errors == row_errors and lower_index[case] < row_lower
+            ):
+                row_errors = errors
+                row_lower = lower_index[case]
+                row_case = case
+
+        if row_errors < best_errors:
+            best_errors = row_errors
+            best_lower, best_upper, best_case = row_lower, upper, row_case
+
+    return best_lower, best_upper, best_case
@@ -75,57 +75,16 @@ class CutLayer(keras.Layer):
         return int(ops.convert_to_numpy(self._case))
 
     def call(self, x):
-        y_pred = ops.cond(
-            ops.equal(self._case, 0),
-            lambda: ops.where(x <= self._cut_left, 1.0, 0.0),
-            lambda: ops.cond(
-                ops.equal(self._case, 1),
-                lambda: ops.where(x >= self._cut_left, 1.0, 0.0),
-                lambda: ops.cond(
-                    ops.equal(self._case, 2),
-                    lambda: ops.where(
-                        ops.logical_and(x >= self._cut_left, x <= self._cut_right),
-                        1.0,
-                        0.0,
-                    ),
-                    lambda: ops.where(
-                        ops.logical_or(x <= self._cut_left, x >= self._cut_right),
-                        1.0,
-                        0.0,
-                    ),
-                ),
-            ),
-        )
-
-        return y_pred
+        mask = cut_mask(x, self._cut_left, self._cut_right, self._case)
+        return ops.where(mask, 1.0, 0.0)
 
     def apply_cut(self, x, cut_mark=-1.0):
         x = ops.cast(x, "float32")
         if ops.ndim(x) == 2:
             x = ops.take(x, self.feature_id, axis=-1)
 
-        y_pred = ops.cond(
-            ops.equal(self._case, 0),
-            lambda: ops.where(x <= self._cut_left, 1.0, cut_mark),
-            lambda: ops.cond(
-                ops.equal(self._case, 1),
-                lambda: ops.where(x >= self._cut_left, 1.0, cut_mark),
-                lambda: ops.cond(
-                    ops.equal(self._case, 2),
-                    lambda: ops.where(
-                        ops.logical_and(x >= self._cut_left, x <= self._cut_right),
-                        1.0,
-                        cut_mark,
-                    ),
-                    lambda: ops.where(
-                        ops.logical_or(x <= self._cut_left, x >= self._cut_right),
-                        1.0,
-                        cut_mark,
-                    ),
-                ),
-            ),
-        )
-        return y_pred
+        mask = cut_mask(x, self._cut_left, self._cut_right, self._case)
+        return ops.where(mask, 1.0, cut_mark)
 
     def compute_output_shape(self, input_shape):
         return input_shape
@@ -140,3 +99,40 @@ class CutLayer(keras.Layer):
             }
         )
         return config
+
+
+def cut_mask(x, cut_left, cut_right, case):
+    """Select samples passing a cut without branching on its case.
+
+    All four cases are evaluated and the one matching `case` is picked per
+    element, so the parameters may be scalars or arrays broadcast against x,
+    e.g. one value per feature for x of shape (n_samples, n_features).
+
+    Parameters
+    ----------
+    x: tensor
+        Observable values.
+    cut_left, cut_right: float or tensor
+        Lower and upper cut values.
+    case: int or tensor
+        0: left, 1: right, 2: middle, 3: both sides.
+
+    Return
+    ------
+    mask: bool tensor
+        True for samples passing the cut.
+    """
+    on_left = ops.less_equal(x, cut_left)
+    on_right = ops.greater_equal(x, cut_left)
+    in_middle = ops.logical_and(on_right, ops.less_equal(x, cut_right))
+    on_both_sides = ops.logical_or(on_left, ops.greater_equal(x, cut_right))
+
+    return ops.where(
+        ops.equal(case, 0),
+        on_left,
+        ops.where(
+            ops.equal(case, 1),
+            on_right,
+            ops.where(ops.equal(case, 2), in_middle, on_both_sides),
+        ),
+    )
@@ -1 +1,2 @@
 from .gradient_boosted_decision_tree import GradientBoostedDecisionTree
+from .hist_gradient_boosted_decision_tree import HistGradientBoostedDecisionTree
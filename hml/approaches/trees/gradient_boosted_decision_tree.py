@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from pathlib import Path
 from typing import Any, Literal, NamedTuple
 
 import dill as pickle
 import keras
+import numpy as np
 from numpy import ndarray
 from numpy.random import RandomState
 from sklearn.base import BaseEstimator
@@ -39,7 +39,56 @@ class History(NamedTuple):
     history: dict[str, Any]
 
 
-class GradientBoostedDecisionTree(GradientBoostingClassifier):
+def get_metric_pairs(metrics, is_categorical):
+    metric_pairs = []
+    for metric in metrics:
+        if issubclass(type(metric), keras.metrics.Metric):
+            metric_pairs.append((metric.name, metric))
+        elif metric in KERAS_METRICS:
+            metric_pairs.append((metric, KERAS_METRICS[metric]()))
+        elif metric in ["accuracy", "acc"]:
+            if is_categorical:
+                metric_pairs.append((metric, keras.metrics.CategoricalAccuracy()))
+            else:
+                metric_pairs.append((metric, keras.metrics.SparseCategoricalAccuracy()))
+        else:
+            raise ValueError(f"Unknown metric: {metric}")
+
+    return metric_pairs
+
+
+class TreeApproachMixin:
+    """Keras-like summary and saving shared by the tree approaches."""
+
+    def summary(self, deep=False, **kwargs):
+        output = [f'Model: "{self.name}"']
+        for name, value in self.get_params(deep=deep, **kwargs).items():
+            output.append(f"- {name}: {value}")
+
+        print("\n".join(output))
+
+    def save(
+        self,
+        filepath,
+        overwrite=True,
+        save_format: Literal["pickle"] = "pickle",
+    ):
+        filepath = Path(filepath)
+        if filepath.suffix != "":
+            save_format = filepath.suffix[1:]  # type: ignore
+
+        filepath = filepath.with_suffix(f".{save_format}")
+        if not overwrite and filepath.exists():
+            raise FileExistsError(f"File already exists: {filepath}")
+
+        with filepath.open("wb") as f:
+            if save_format == "pickle":
+                pickle.dump(self, f)
+            else:
+                raise ValueError(f"save_format {save_format} not supported")
+
+
+class GradientBoostedDecisionTree(TreeApproachMixin, GradientBoostingClassifier):
     def __init__(
         self,
         name: str = "gradient_boosted_decision_tree",
@@ -106,7 +155,6 @@ class GradientBoostedDecisionTree(GradientBoostingClassifier):
     ):
         is_categorical = y.ndim == 2
         pb = keras.utils.Progbar(self.n_estimators, verbose=verbose)  # type: ignore
-        history = History(history=defaultdict(list))
 
         if validation_data is not None:
             self.x_val, self.y_val = validation_data
@@ -116,25 +164,19 @@ class GradientBoostedDecisionTree(GradientBoostingClassifier):
             self.y_val = y[-int(validation_split * len(y)) :]
             y = y[: -int(validation_split * len(y))]
 
-        self.metric_pairs = []
-        for metric in self.metrics:
-            if issubclass(type(metric), keras.metrics.Metric):
-                self.metric_pairs.append((metric.name, metric))
-            elif metric in KERAS_METRICS:
-                self.metric_pairs.append((metric, KERAS_METRICS[metric]()))
-            elif metric in ["accuracy", "acc"]:
-                if is_categorical:
-                    self.metric_pairs.append(
-                        (metric, keras.metrics.CategoricalAccuracy())
-                    )
-                else:
-                    self.metric_pairs.append(
-                        (metric, keras.metrics.SparseCategoricalAccuracy())
-                    )
-            else:
-                raise ValueError(f"Unknown metric: {metric}")
+        self.metric_pairs = get_metric_pairs(self.metrics, is_categorical)
+
+        # Preallocate one entry per boosting stage and trim after fitting, in
+        # case early stopping ends it before n_estimators
+        has_validation = validation_split != 0.0 or validation_data is not None
+        names = ["loss"] + [name for name, _ in self.metric_pairs]
+        if has_validation:
+            names += ["val_" + name for name in names]
+        history = History(history={k: np.empty(self.n_estimators) for k in names})
+        n_stages = 0
 
         def _monitor(i, model, local_variables):
+            nonlocal n_stages
             y_true = local_variables["y"]
             raw_pred = local_variables["raw_predictions"]
 
@@ -154,16 +196,17 @@ class GradientBoostedDecisionTree(GradientBoostingClassifier):
 
             # Train metrics
             train_values = [("loss", loss)]
-            history.history["loss"].append(loss)
-            for name, i in self.metric_pairs:
-                i.reset_state()
-                i.update_state(y_true, y_prob, sample_weight=sample_weight)
-                train_values.append((name, i.result().numpy()))
-                history.history[name].append(i.result().numpy())
+            history.history["loss"][n_stages] = loss
+            for name, metric in self.metric_pairs:
+                metric.reset_state()
+                metric.update_state(y_true, y_prob, sample_weight=sample_weight)
+                value = metric.result().numpy()
+                train_values.append((name, value))
+                history.history[name][n_stages] = value
 
             # Validation metrics
             val_values = []
-            if validation_split != 0.0 or validation_data is not None:
+            if has_validation:
                 # Reshape y_val and change dtype to match the previous one
                 y_true = (
                     self.y_val if self.y_val.ndim == 1 else self.y_val.argmax(axis=1)
@@ -184,48 +227,26 @@ class GradientBoostedDecisionTree(GradientBoostingClassifier):
                 # print(y_true.shape, raw_pred.shape, y_prob.shape, sample_weight.shape)
                 val_loss = model._loss(y_true, raw_pred)  # , sample_weight)
                 val_values.append(("val_loss", val_loss))
-                history.history["val_loss"].append(val_loss)
+                history.history["val_loss"][n_stages] = val_loss
 
-                for name, i in self.metric_pairs:
-                    i.reset_state()
-                    i.update_state(self.y_val, y_prob)
-                    val_values.append(("val_" + name, i.result().numpy()))
-                    history.history["val_" + name].append(i.result().numpy())
+                for name, metric in self.metric_pairs:
+                    metric.reset_state()
+                    metric.update_state(self.y_val, y_prob)
+                    value = metric.result().numpy()
+                    val_values.append(("val_" + name, value))
+                    history.history["val_" + name][n_stages] = value
 
             pb.add(1, values=[("loss", loss)] + train_values + val_values)
+            n_stages += 1
 
             return False
 
         y = y if not is_categorical else y.argmax(axis=1)
         _ = super().fit(x, y, sample_weight, _monitor)
+        for name, values in history.history.items():
+            history.history[name] = values[:n_stages].tolist()
+
         return history
 
     def predict(self, x: ndarray, **kwargs) -> ndarray:
         return super().predict_proba(x)
-
-    def summary(self, deep=False, **kwargs):
-        output = [f'Model: "{self.name}"']
-        for name, value in self.get_params(deep=deep, **kwargs).items():
-            output.append(f"- {name}: {value}")
-
-        print("\n".join(output))
-
-    def save(
-        self,
-        filepath,
-        overwrite=True,
-        save_format: Literal["pickle"] = "pickle",
-    ):
-        filepath = Path(filepath)
-        if filepath.suffix != "":
-            save_format = filepath.suffix[1:]  # type: ignore
-
-        filepath = filepath.with_suffix(f".{save_format}")
-        if not overwrite and filepath.exists():
-            raise FileExistsError(f"File already exists: {filepath}")
-
-        with filepath.open("wb") as f:
-            if save_format == "pickle":
-                pickle.dump(self, f)
-            else:
-                raise ValueError(f"save_format {save_format} not supported")
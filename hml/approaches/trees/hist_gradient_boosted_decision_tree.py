@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import keras
+import numpy as np
+from numpy import ndarray
+from numpy.random import RandomState
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import log_loss
+
+from .gradient_boosted_decision_tree import (
+    History,
+    TreeApproachMixin,
+    get_metric_pairs,
+)
+
+
+class HistGradientBoostedDecisionTree(
+    TreeApproachMixin, HistGradientBoostingClassifier
+):
+    """Gradient boosted decision tree with histogram-based split finding.
+
+    Features are binned into at most `max_bins` bins before training, so split
+    finding scales with the number of bins instead of sorting the samples, and
+    it runs on all cores. It is much faster than `GradientBoostedDecisionTree`
+    on large datasets and shares the same Keras-like interface.
+    """
+
+    def __init__(
+        self,
+        name: str = "hist_gradient_boosted_decision_tree",
+        *,
+        loss: Literal["log_loss"] = "log_loss",
+        learning_rate: float = 0.1,
+        max_iter: int = 100,
+        max_leaf_nodes: int | None = 31,
+        max_depth: int | None = None,
+        min_samples_leaf: int = 20,
+        l2_regularization: float = 0,
+        max_bins: int = 255,
+        categorical_features: ndarray | None = None,
+        monotonic_cst: ndarray | dict | None = None,
+        interaction_cst: list | None = None,
+        warm_start: bool = False,
+        early_stopping: Literal["auto"] | bool = False,
+        scoring: str | None = "loss",
+        validation_fraction: float | None = 0.1,
+        n_iter_no_change: int = 10,
+        tol: float = 1e-7,
+        verbose: int = 0,
+        random_state: int | RandomState | None = None,
+        class_weight: dict | Literal["balanced"] | None = None,
+    ) -> None:
+        super().__init__(
+            loss=loss,
+            learning_rate=learning_rate,
+            max_iter=max_iter,
+            max_leaf_nodes=max_leaf_nodes,
+            max_depth=max_depth,
+            min_samples_leaf=min_samples_leaf,
+            l2_regularization=l2_regularization,
+            max_bins=max_bins,
+            categorical_features=categorical_features,
+            monotonic_cst=monotonic_cst,
+            interaction_cst=interaction_cst,
+            warm_start=warm_start,
+            early_stopping=early_stopping,
+            scoring=scoring,
+            validation_fraction=validation_fraction,
+            n_iter_no_change=n_iter_no_change,
+            tol=tol,
+            verbose=verbose,
+            random_state=random_state,
+            class_weight=class_weight,
+        )
+        self.name = name
+        self.metrics = []
+
+    def compile(self, optimizer=None, loss="log_loss", metrics=None):
+        self.optimizer = optimizer
+        self.set_params(loss=loss)
+        self.metrics = metrics or []
+
+    def fit(
+        self,
+        x: ndarray,
+        y: ndarray,
+        validation_split: float = 0.0,
+        validation_data: tuple[ndarray, ndarray] | None = None,
+        sample_weight: ndarray | None = None,
+        verbose: int = 1,
+    ):
+        is_categorical = y.ndim == 2
+
+        if validation_data is not None:
+            self.x_val, self.y_val = validation_data
+        elif validation_split != 0.0:
+            self.x_val = x[-int(validation_split * len(x)) :]
+            x = x[: -int(validation_split * len(x))]
+            self.y_val = y[-int(validation_split * len(y)) :]
+            y = y[: -int(validation_split * len(y))]
+
+        self.metric_pairs = get_metric_pairs(self.metrics, is_categorical)
+        has_validation = validation_split != 0.0 or validation_data is not None
+
+        y_true = y
+        y = y if not is_categorical else y.argmax(axis=1)
+        _ = super().fit(x, y, sample_weight)
+
+        # There is no monitor during fitting, so replay the fitted iterations
+        # to record the history once the trees are built
+        pb = keras.utils.Progbar(self.n_iter_, verbose=verbose)  # type: ignore
+        names = ["loss"] + [name for name, _ in self.metric_pairs]
+        if has_validation:
+            names += ["val_" + name for name in names]
+        history = History(history={k: np.empty(self.n_iter_) for k in names})
+
+        stages = [self.staged_predict_proba(x)]
+        if has_validation:
+            y_val = self.y_val if self.y_val.ndim == 1 else self.y_val.argmax(axis=1)
+            stages.append(self.staged_predict_proba(self.x_val))
+
+        for i, y_probs in enumerate(zip(*stages)):
+            values = []
+            for prefix, target, true, y_prob, weight in zip(
+                ["", "val_"],
+                [y, y_val if has_validation else None],
+                [y_true, self.y_val if has_validation else None],
+                y_probs,
+                [sample_weight, None],
+            ):
+                loss = log_loss(
+                    target, y_prob, sample_weight=weight, labels=self.classes_
+                )
+                values.append((prefix + "loss", loss))
+
+                for name, metric in self.metric_pairs:
+                    metric.reset_state()
+                    metric.update_state(true, y_prob, sample_weight=weight)
+                    values.append((prefix + name, metric.result().numpy()))
+
+            for name, value in values:
+                history.history[name][i] = value
+            pb.add(1, values=values)
+
+        for name, values in history.history.items():
+            history.history[name] = values.tolist()
+
+        return history
+
+    def predict(self, x: ndarray, **kwargs) -> ndarray:
+        return super().predict_proba(x)
@@ -52,35 +52,16 @@ class ImageDataset:
             else:
                 self._samples = ak.concatenate([self._samples, image_values])
 
-            if self.image.been_pixelated:
-                if isinstance(self._targets, list):
-                    self._targets = ak.values_astype(
-                        ak.Array([target] * len(image_values)), "int32"
-                    )
-                else:
-                    self._targets = ak.concatenate(
-                        [
-                            self._targets,
-                            ak.values_astype(
-                                ak.Array([target] * len(image_values)), "int32"
-                            ),
-                        ]
-                    )
-
+            # Fill the targets as one numpy buffer instead of a list per sample
+            n_samples = len(
+                image_values if self.image.been_pixelated else image_values[0]
+            )
+            targets = ak.Array(np.full(n_samples, target, "int32"))
+            if isinstance(self._targets, list):
+                self._targets = targets
             else:
-                if isinstance(self._targets, list):
-                    self._targets = ak.values_astype(
-                        ak.Array([target] * len(image_values[0])), "int32"
-                    )
-                else:
-                    self._targets = ak.concatenate(
-                        [
-                            self._targets,
-                            ak.values_astype(
-                                ak.Array([target] * len(image_values[0])), "int32"
-                            ),
-                        ]
-                    )
+                self._targets = ak.concatenate([self._targets, targets])
+
                 # self._samples[0].append(self.image.values[0])
                 # self._samples[1].append(self.image.values[1])
 
@@ -210,8 +191,8 @@ class ImageDataset:
         if self.image.been_pixelated:
             return np.array(self._samples, dtype=np.float32)
         else:
-            height = ak.from_iter(self._samples[0])
-            width = ak.from_iter(self._samples[1])
+            height = ak.Array(self._samples[0])
+            width = ak.Array(self._samples[1])
 
             # 1D non-pixelated data should come from a loaded dataset
             if height.ndim == 1:
@@ -52,17 +52,12 @@ class SetDataset:
         else:
             self._samples = ak.concatenate([self._samples, set_values])
 
+        # Fill the targets as one numpy buffer instead of a list per sample
+        targets = ak.Array(np.full(len(set_values), target, "int32"))
         if isinstance(self._targets, list):
-            self._targets = ak.values_astype(
-                ak.Array([target] * len(set_values)), "int32"
-            )
+            self._targets = targets
         else:
-            self._targets = ak.concatenate(
-                [
-                    self._targets,
-                    ak.values_astype(ak.Array([target] * len(set_values)), "int32"),
-                ]
-            )
+            self._targets = ak.concatenate([self._targets, targets])
 
     def split(self, train, test, val=None, seed=None):
         train *= 10
@@ -203,7 +198,8 @@ class SetDataset:
         return np.hstack([self.samples, self.targets[:, None]])
 
     def to_pandas(self):
-        df = pd.DataFrame(self.samples.tolist(), columns=self.feature_names)
+        samples = self.samples.reshape(-1, len(self.feature_names))
+        df = pd.DataFrame(samples, columns=self.feature_names)
         df["Target"] = self.targets
         return df
 
@@ -233,6 +229,7 @@ class SetDataset:
     def show(self, n_feature_per_line=3, n_samples=-1, target=None):
         df = self.to_pandas()
         df = df.sample(n=n_samples) if n_samples != -1 else df
+        df = df if target is None else df.query(f"Target == {target}")
 
         n_features = len(self.feature_names)
         n_rows = (n_features + n_feature_per_line - 1) // n_feature_per_line
@@ -242,7 +239,7 @@ class SetDataset:
             ax = plt.subplot(n_rows, n_feature_per_line, i + 1)
 
             sns.histplot(
-                df if target is None else df.query(f"Target == {target}"),
+                df,
                 x=name,
                 hue="Target",
                 bins=40,
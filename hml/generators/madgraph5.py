@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import html
+import json
+import os
 import re
 import shutil
 import subprocess
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Union
@@ -14,6 +21,41 @@ from rich.table import Table
 
 PathLike = Union[str, Path]
 
+_PROCESSES_PATTERN = re.compile(
+    r"<h2[^>]*>\s*Results in the [^<]+ for ([^<]+?)\s*</h2>", re.IGNORECASE
+)
+
+
+@lru_cache
+def _parse_crossx_table(crossx_file: Path, mtime_ns: int, size: int) -> dict:
+    # The modification time and size are only part of the cache key, so that
+    # the table is parsed again once Madgraph5 updates the file
+    with crossx_file.open() as f:
+        soup = BeautifulSoup(f, "html.parser")
+
+    table = soup.find("table")
+    rows = {}
+    for row in table.find_all("tr")[1:]:  # type: ignore
+        columns = [i.text for i in row.find_all("td")]
+        rows[columns[0]] = columns
+
+    return rows
+
+
+def _read_crossx_table(crossx_file: Path) -> dict:
+    """Read the cell texts of each run in crossx.html, keyed by the run name."""
+    stat = crossx_file.stat()
+    return _parse_crossx_table(crossx_file.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+def _load_runs(output_dir: Path, names: list[str]) -> list[Madgraph5Run]:
+    # Loading a run is dominated by globbing and reading its files, so load
+    # them concurrently once the shared crossx.html is parsed
+    if names:
+        _read_crossx_table(output_dir / "crossx.html")
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(lambda i: Madgraph5Run(output_dir, i), names))
+
 
 class Madgraph5:
     def __init__(
@@ -80,19 +122,23 @@ class Madgraph5:
         end_marker: str = r"MG5_aMC>$",
         timeout: int | None = None,
     ) -> str:
-        output = ""
+        lines = []
+        # expect() blocks until output arrives; compile the markers once
+        # instead of for every line
+        markers = self.child.compile_pattern_list([start_marker, end_marker])
         self.child.sendline(command)
         while True:
-            if self.child.expect([start_marker, end_marker], timeout) == 1:  # type: ignore
+            if self.child.expect_list(markers, timeout) == 1:  # type: ignore
                 break
 
-            middle_output = self.child.before.decode()
-            output += middle_output + "\r\n"
+            # Keep the raw bytes and decode the whole log once at the end
+            lines.append(self.child.before)
             if self.verbose > 0:
-                print(middle_output)
+                print(self.child.before.decode())
 
         self.clean_pypy()
-        return output
+        # Join once at the end, since launch logs can run to many lines
+        return b"".join(line + b"\r\n" for line in lines).decode()
 
     def clean_pypy(self):
         py_py = Path("py.py")
@@ -119,17 +165,20 @@ class Madgraph5:
         except AttributeError:
             pass
 
-        # 2nd case: from_output() has been called
+        # 2nd case: from_output() has been called. The title of crossx.html is
+        # static once the output is created, so parse it once and keep it.
         try:
             crossx = self.output_dir / "crossx.html"
-            with crossx.open() as f:
-                soup = BeautifulSoup(f, "html.parser")
-                title_col = soup.find_all("h2")[0].text.strip()
-                processes = re.findall(r"^Results in the .+ for (.+)", title_col)[0]
-                return processes.split(",")
         except AttributeError:
             raise AttributeError("No processes defined yet")
 
+        if (match := _PROCESSES_PATTERN.search(crossx.read_text())) is None:
+            raise AttributeError("No processes defined yet")
+
+        # The header is raw HTML, so decode entities such as &gt; as well
+        self._processes = html.unescape(match.group(1)).split(",")
+        return self._processes
+
     def display_diagrams(
         self, diagram_dir: PathLike = "Diagrams", overwrite: bool = True
     ):
@@ -143,8 +192,13 @@ class Madgraph5:
         self.diagram_dir.mkdir(parents=True)
         self.process_log += self.run_command(f"display diagrams {self.diagram_dir}")
 
+        # Convert with argv lists to skip the intermediate shell
+        if (ps2pdf := shutil.which("ps2pdf")) is None:
+            warnings.warn("ps2pdf not found, diagrams are kept as EPS files")
+            return
+
         for eps in self.diagram_dir.glob("*.eps"):
-            subprocess.run(f"ps2pdf {eps} {eps.with_suffix('.pdf')}", shell=True)
+            subprocess.run([ps2pdf, eps, eps.with_suffix(".pdf")], check=True)
 
     def output(self, output_dir: PathLike | None = None, overwrite: bool = True):
         if output_dir is None:
@@ -196,29 +250,41 @@ class Madgraph5:
         multi_run=1,
         seed=None,
         dry=False,
+        reuse_grids=False,
     ):
         run_log = ""
 
+        # Skip the survey and refine when the integration grids of the last
+        # launch were made with the same settings
+        only_generation = False
+        if reuse_grids:
+            grid_key = self._get_grid_key(madspin, settings, decays, cards)
+            grid_key_file = self.output_dir / ".grid_key"
+            only_generation = (
+                multi_run == 1
+                and grid_key_file.exists()
+                and grid_key_file.read_text() == grid_key
+            )
+
         # In the middle: MadEvent CLI ends with '>'
-        commands = f"launch -i {self.output_dir}\n"
-        if multi_run == 1:
-            commands += "generate_events\n"
+        # Collect the command lines and join them once at the end
+        commands = [f"launch -i {self.output_dir}"]
+        if only_generation:
+            commands.append("generate_events --only_generation")
+        elif multi_run == 1:
+            commands.append("generate_events")
         else:
-            commands += f"multi_run {multi_run}\n"
+            commands.append(f"multi_run {multi_run}")
 
-        commands += f"shower={shower}\n"
-        commands += f"detector={detector}\n"
-        commands += f"madspin={madspin}\n"
-        commands += "done\n"
+        commands.append(f"shower={shower}")
+        commands.append(f"detector={detector}")
+        commands.append(f"madspin={madspin}")
+        commands.append("done")
 
         if seed is not None:
             settings["iseed"] = seed
-        if settings != {}:
-            commands += "\n".join([f"set {k} {v}" for k, v in settings.items()])
-            commands += "\n"
-
-        if decays != []:
-            commands += "\n".join([f"decay {i}" for i in decays]) + "\n"
+        commands += [f"set {k} {v}" for k, v in settings.items()]
+        commands += [f"decay {i}" for i in decays]
 
         default_pythia8_card = self.output_dir / "Cards/pythia8_card_default.dat"
         default_delphes_card = self.output_dir / "Cards/delphes_card_default.dat"
@@ -266,7 +332,7 @@ class Madgraph5:
                     ) as temp:
                         temp.write("".join(lines).encode())
 
-                    resolved_cards.append(temp.name)
+                resolved_cards.append(temp.name)
 
             if detector == "on" or detector == "delphes":
                 delphes_card = None
@@ -304,20 +370,39 @@ class Madgraph5:
                 resolved_cards.append(temp.name)
 
         if resolved_cards != []:
-            commands += "\n".join(resolved_cards) + "\n"
+            commands += resolved_cards
         else:
-            commands += "\n".join(cards) + "\n"
-        commands += "done\n"
+            commands += cards if cards != [] else [""]
+        commands.append("done")
+        commands = "\n".join(commands) + "\n"
 
         if dry:
             return commands
 
         run_log += self.run_command(commands, end_marker=r">$")
 
+        # Madgraph5 copies the cards into the output directory, so the seeded
+        # copies are not needed once the launch is done
+        for card in resolved_cards:
+            Path(card).unlink(missing_ok=True)
+
         # In the end: Back to Madgraph CLI
         run_log += self.run_command("exit")
 
-        run_name = re.findall(r"survey  (.+) \r\n", run_log)[0]
+        # Only a single generate_events with its own survey leaves grids that
+        # match the key; a multi_run may have replaced them
+        if reuse_grids and not only_generation:
+            if multi_run == 1:
+                grid_key_file.write_text(grid_key)
+            else:
+                grid_key_file.unlink(missing_ok=True)
+
+        # Generating with existing grids skips the survey, so fall back to the
+        # newest run when its name is not echoed
+        if (match := re.search(r"survey  (.+) \r\n", run_log)) is not None:
+            run_name = match.group(1)
+        else:
+            run_name = self._get_latest_run_name()
         run_log_file = self.log_dir / f"{run_name}.log"
         run_log_file = run_log_file.resolve()
         with run_log_file.open("w") as f:
@@ -329,18 +414,49 @@ class Madgraph5:
             else:
                 print("Run log saved to", run_log_file)
 
+    def _get_grid_key(self, madspin, settings, decays, cards) -> str:
+        # The number of events, the seed, and the shower and detector cards
+        # do not change the integration grids
+        invariants = {
+            "madspin": madspin,
+            "settings": {
+                k: str(v) for k, v in settings.items() if k not in ["nevents", "iseed"]
+            },
+            "decays": list(decays),
+            "cards": [
+                Path(i).read_text()
+                for i in cards
+                if "pythia8" not in str(i) and "delphes" not in str(i)
+            ],
+        }
+        content = json.dumps(invariants, sort_keys=True).encode()
+
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def _get_latest_run_name(self) -> str:
+        names = [i.name for i in self.output_dir.glob("Events/run_*") if i.is_dir()]
+        names = [i for i in names if i.count("_") == 1]
+
+        return max(names, key=lambda x: int(x.split("_")[-1]))
+
     @property
     def runs(self) -> list[Madgraph5Run]:
-        run_paths = []
-        for i in self.output_dir.glob("Events/run_*"):
-            if i.is_dir() and i.name.count("_") == 1:
-                run_paths.append(i)
+        # No launch has finished yet
+        if not (events_dir := self.output_dir / "Events").is_dir():
+            return []
+
+        # Directory entries carry their type, so no extra stat per entry
+        with os.scandir(events_dir) as entries:
+            names = [
+                i.name
+                for i in entries
+                if i.name.startswith("run_") and i.name.count("_") == 1 and i.is_dir()
+            ]
 
         # Sort the runs by their number
-        run_paths = sorted(run_paths, key=lambda x: int(x.name.split("_")[-1]))
-        runs = [Madgraph5Run(self.output_dir, i.name) for i in run_paths]
+        names = sorted(names, key=lambda x: int(x.split("_")[-1]))
 
-        return runs
+        return _load_runs(self.output_dir, names)
 
     def summary(self):
         console = Console()
@@ -398,9 +514,13 @@ class Madgraph5Run:
 
         self._info = self._get_info(output_dir, name)
         self._subs = []
-        for i in self._events_dir.glob(f"{name}_*"):
-            if i.is_dir():
-                self._subs.append(i)
+        self._sub_runs = None
+        self._root_files = None
+        if self._events_dir.is_dir():
+            with os.scandir(self._events_dir) as entries:
+                for i in entries:
+                    if i.name.startswith(f"{name}_") and i.is_dir():
+                        self._subs.append(self._events_dir / i.name)
 
     @property
     def directory(self) -> Path:
@@ -436,25 +556,32 @@ class Madgraph5Run:
 
     @property
     def sub_runs(self) -> list[Madgraph5Run]:
-        return [Madgraph5Run(self.output_dir, i.name) for i in self._subs]
+        if self._sub_runs is None:
+            self._sub_runs = _load_runs(self.output_dir, [i.name for i in self._subs])
+
+        return self._sub_runs
 
     def events(self, file_format="root"):  # type: ignore
         if file_format == "root":
-            root_files = []
-            # events = ROOT.TChain("Delphes")  # type: ignore
-            if self.sub_runs != []:
-                for run in self.sub_runs:
-                    for root_file in run.directory.glob("*.root"):
+            # The listing only changes with a new launch, which creates a new
+            # run, so glob the run directories once
+            if self._root_files is None:
+                root_files = []
+                # events = ROOT.TChain("Delphes")  # type: ignore
+                if self.sub_runs != []:
+                    for run in self.sub_runs:
+                        for root_file in run.directory.glob("*.root"):
+                            root_files.append(f"{root_file.as_posix()}:Delphes")
+                else:
+                    for root_file in self.directory.glob("*.root"):
                         root_files.append(f"{root_file.as_posix()}:Delphes")
-            else:
-                for root_file in self.directory.glob("*.root"):
-                    root_files.append(f"{root_file.as_posix()}:Delphes")
+                self._root_files = root_files
 
             # keys = uproot.open(root_files[0]).keys()
             # keys = [key for key in keys if "fBits" not in key]
 
             # events = uproot.concatenate(root_files, filter_name=keys)
-            events = root_files
+            events = list(self._root_files)
         else:
             raise ValueError(f"File format {file_format} not supported yet.")
 
@@ -479,62 +606,54 @@ class Madgraph5Run:
         events_dir = output_dir / "Events"
         run_dir = events_dir / name
 
-        if list(run_dir.glob("*_banner.txt")) != []:
-            banner_file = list(run_dir.glob("*_banner.txt"))[0]
-        elif list(events_dir.glob(f"{name}_banner.txt")) != []:
-            banner_file = list(events_dir.glob(f"{name}_banner.txt"))[0]
+        if banner_files := list(run_dir.glob("*_banner.txt")) or list(
+            events_dir.glob(f"{name}_banner.txt")
+        ):
+            banner_file = banner_files[0]
         else:
             raise FileNotFoundError("Banner file not found")
 
         crossx_file = output_dir / "crossx.html"
-
-        with crossx_file.open() as f:
-            soup = BeautifulSoup(f, "html.parser")
-
-        table = soup.find("table")
         run = {}
-        for row in table.find_all("tr")[1:]:  # type: ignore
-            columns = row.find_all("td")
-            if columns[0].text != name:
-                continue
-
+        if (columns := _read_crossx_table(crossx_file).get(name)) is not None:
             # Name
             run["name"] = name
 
             # Collider
-            collider_col = columns[1].text.split()
+            collider_col = columns[1].split()
             lpp1, lpp2 = collider_col[:2]
             ebeam1, ebeam2 = collider_col[2], collider_col[4]
             run["collider"] = f"{lpp1}{lpp2}:{ebeam1}x{ebeam2}"
 
             # Banner
-            banner_col = columns[2].text.split()
+            banner_col = columns[2].split()
             run["tag"] = banner_col[0]
 
             with banner_file.open() as f:
-                for line in f.readlines():
+                for line in f:
                     if "iseed" in line:
                         run["seed"] = int(line.split("=")[0].strip())
                         break
 
             # Cross section and error
-            cross_col = columns[3].text.split()
+            cross_col = columns[3].split()
             cross = float(cross_col[0])
             error = float(cross_col[2])
             run["cross"] = cross
             run["error"] = error
 
             # N Events
-            events_col = columns[4].text.split()
+            events_col = columns[4].split()
             run["n_events"] = int(events_col[0])
 
             # ROOT file path
             run["events"] = {}
-            if list(run_dir.glob("*lhe*")) != []:
-                run["events"]["lhe"] = list(run_dir.glob("*lhe*"))[0].as_posix()
-            if list(run_dir.glob("*hepmc*")) != []:
-                run["events"]["hepmc"] = list(run_dir.glob("*hepmc*"))[0].as_posix()
-            if list(run_dir.glob("*.root")) != []:
-                run["events"]["root"] = list(run_dir.glob("*.root"))[0].as_posix()
+            for key, pattern in [
+                ("lhe", "*lhe*"),
+                ("hepmc", "*hepmc*"),
+                ("root", "*.root"),
+            ]:
+                if files := list(run_dir.glob(pattern)):
+                    run["events"][key] = files[0].as_posix()
 
         return run
@@ -2,13 +2,7 @@ from __future__ import annotations
 
 from keras import ops
 from keras.config import epsilon
-from keras.metrics import (
-    FalseNegatives,
-    FalsePositives,
-    Metric,
-    TrueNegatives,
-    TruePositives,
-)
+from keras.metrics import Metric
 
 
 class MaxSignificance(Metric):
@@ -44,6 +38,30 @@ class MaxSignificance(Metric):
         else:
             self.thresholds = thresholds
 
+        # Thresholds chosen automatically are only known after the first update
+        if self.thresholds != "auto":
+            self._build_confusion_matrix(len(self.thresholds))
+
+    def _build_confusion_matrix(self, n_thresholds):
+        # One vector per count, holding the value at every threshold. The
+        # negatives follow from the totals, which need no threshold axis.
+        self.true_positives = self.add_weight(
+            (n_thresholds,), "zeros", name="true_positives"
+        )
+        self.false_positives = self.add_weight(
+            (n_thresholds,), "zeros", name="false_positives"
+        )
+        self.positives = self.add_weight((), "zeros", name="positives")
+        self.negatives = self.add_weight((), "zeros", name="negatives")
+
+    @property
+    def true_negatives(self):
+        return self.negatives - self.false_positives
+
+    @property
+    def false_negatives(self):
+        return self.positives - self.true_positives
+
     def update_state(self, y_true, y_pred, sample_weight=None):
         y_t_ndim = ops.ndim(ops.squeeze(y_true))
         y_p_ndim = ops.ndim(ops.squeeze(y_pred))
@@ -54,54 +72,53 @@ class MaxSignificance(Metric):
 
         if self.thresholds == "auto":
             self.thresholds = calculate_thresholds(y_pred).numpy().tolist()
-
-        self.metric_tp = TruePositives(thresholds=self.thresholds, dtype=self.dtype)
-        self.metric_fp = FalsePositives(thresholds=self.thresholds, dtype=self.dtype)
-        self.metric_tn = TrueNegatives(thresholds=self.thresholds, dtype=self.dtype)
-        self.metric_fn = FalseNegatives(thresholds=self.thresholds, dtype=self.dtype)
-
-        self.metric_tp.update_state(y_true, valid_y_pred)
-        self.metric_fp.update_state(y_true, valid_y_pred)
-        self.metric_tn.update_state(y_true, valid_y_pred)
-        self.metric_fn.update_state(y_true, valid_y_pred)
+            self._build_confusion_matrix(len(self.thresholds))
+
+        # Compare all predictions against all thresholds at once: (N, T)
+        thresholds = ops.convert_to_tensor(self.thresholds, self.dtype)
+        valid_y_pred = ops.cast(ops.reshape(valid_y_pred, (-1, 1)), self.dtype)
+        is_predicted = ops.cast(ops.greater(valid_y_pred, thresholds), self.dtype)
+        is_positive = ops.cast(ops.cast(ops.reshape(y_true, (-1,)), "bool"), self.dtype)
+        is_negative = 1 - is_positive
+
+        tp = ops.matmul(is_positive, is_predicted)
+        fp = ops.matmul(is_negative, is_predicted)
+        self.true_positives.assign_add(tp)
+        self.false_positives.assign_add(fp)
+        self.positives.assign_add(ops.sum(is_positive))
+        self.negatives.assign_add(ops.sum(is_negative))
 
     def result(self):
-        tp = self.metric_tp.result()
-        fn = self.metric_fn.result()
-        tn = self.metric_tn.result()
-        fp = self.metric_fp.result()
-        tpr = tp / (tp + fn)
-        fpr = fp / (fp + tn)
+        tp = self.true_positives.value
+        fp = self.false_positives.value
+        if len(self.thresholds) == 1:
+            tp, fp = tp[0], fp[0]
+
+        tpr = tp / self.positives.value
+        fpr = fp / self.negatives.value
 
         if self.cross_sections == [1, 1]:
             s = tp
             b = fp
         else:
-            if self.thresholds != [0.5]:
-                selection = fpr != 0
-                tpr = tpr[selection]
-                fpr = fpr[selection]
-                thresholds = ops.convert_to_tensor(self.thresholds)[selection]
-            else:
-                thresholds = ops.convert_to_tensor(self.thresholds)
-
+            # Fold all backgrounds into one scale factor of the shared fpr
+            b_scale = sum(x * w for x, w in zip(self.b_xsec, self.b_weight))
             s = self.s_xsec * self.luminosity * self.s_weight * tpr
-            b = sum(
-                [
-                    xsec * self.luminosity * weight * fpr
-                    for xsec, weight in zip(self.b_xsec, self.b_weight)
-                ]
-            )
+            b = b_scale * self.luminosity * fpr
 
         significance = ops.divide(s, ops.sqrt(s + b))
+        if self.cross_sections != [1, 1] and self.thresholds != [0.5]:
+            # Mask thresholds without background instead of gathering the rest,
+            # so the whole computation keeps a static shape
+            significance = ops.where(fpr != 0, significance, float("-inf"))
         self.significance = significance
         max_index = ops.argmax(significance)
 
         if self.thresholds != [0.5]:
-            self.selected_tpr = tpr[max_index]
-            self.selected_fpr = fpr[max_index]
-            self.selected_threshold = thresholds[max_index]
-            max_significance = significance[max_index]
+            self.selected_tpr = ops.take(tpr, max_index)
+            self.selected_fpr = ops.take(fpr, max_index)
+            self.selected_threshold = ops.take(self.thresholds, max_index)
+            max_significance = ops.take(significance, max_index)
         else:
             self.selected_tpr = tpr
             self.selected_fpr = fpr
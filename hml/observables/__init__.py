@@ -11,6 +11,8 @@ from .observable import Observable
 from .size import Size
 from .tag import BTag, TauTag
 
+_TAU_PATTERN = re.compile(r"^tau\d(\d)?$")
+
 
 def get(identifier: str | None) -> Observable | None:
     if identifier is None or identifier == "None":
@@ -29,16 +31,14 @@ def parse_observable(name: str | None, **kwargs) -> Observable | None:
     if name is None or (isinstance(name, str) and name == "None"):
         return
 
-    if (class_name := name.split(".")[-1]) in Observable.aliases:
+    if (class_name := name.rpartition(".")[2]) in Observable.aliases:
         kwargs["class_name"] = class_name
         return Observable.aliases[class_name].from_name(name, **kwargs)
 
-    elif re.match(r"^tau\d$", class_name.lower()):
-        kwargs["class_name"] = class_name
-        return TauN.from_name(name, **kwargs)
-
-    elif re.match(r"^tau\d\d$", class_name.lower()):
+    elif match_ := _TAU_PATTERN.match(class_name.lower()):
         kwargs["class_name"] = class_name
+        if match_.group(1) is None:
+            return TauN.from_name(name, **kwargs)
         return TauMN.from_name(name, **kwargs)
 
     else:
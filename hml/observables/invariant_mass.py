@@ -7,7 +7,7 @@ import vector
 
 from hml.physics_objects.physics_object import PhysicsObject
 
-from ..operations import branch_to_momentum4d
+from ..operations import branch_to_momentum4d, get_branch_keys
 from .observable import Observable
 
 vector.register_awkward()
@@ -23,7 +23,7 @@ class InvariantMass(Observable):
         super().__init__(physics_object, class_name, supported_objects)
 
     def read(self, events):
-        all_keys = {i.lower(): i for i in events.keys(full_paths=False)}
+        all_keys = get_branch_keys(events)
 
         momenta = []
         for obj in self.physics_object.all:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import awkward as ak
+import numba as nb
+import numpy as np
 
 from hml.physics_objects.physics_object import PhysicsObject
 
+from ..operations import empty_lists, get_branch_keys
 from .observable import Observable
 
 
@@ -19,18 +22,25 @@ class NSubjettiness(Observable):
         self.n = n
 
     def read(self, events):
-        all_keys = {i.lower(): i for i in events.keys(full_paths=False)}
+        value = self._read_taus(events)[:, :, self.n - 1]
+        self._value = self._pad(value)
+
+        return self
+
+    def _read_taus(self, events):
+        all_keys = get_branch_keys(events)
         branch = self.physics_object.branch.lower()
         slices = self.physics_object.slices
 
         if f"{branch}.tau[5]" in all_keys:
             key = all_keys[f"{branch}.tau[5]"]
-            array = events[key].array()[:, slices[0]]
-            value = array[:, :, self.n - 1]
+            return events[key].array()[:, slices[0]]
 
         else:
             raise ValueError
 
+    def _pad(self, value):
+        slices = self.physics_object.slices
         for i, slice_ in enumerate(slices):
             if slice_.stop is not None:
                 start = slice_.start if slice_.start is not None else 0
@@ -44,14 +54,10 @@ class NSubjettiness(Observable):
                 else:
                     n_missing = required_length - ak.num(value, i + 1)
                     if ak.sum(n_missing) > 0:
-                        pad = ak.unflatten(
-                            ak.Array([[]] * ak.sum(n_missing)), n_missing
-                        )
+                        pad = ak.unflatten(empty_lists(ak.sum(n_missing)), n_missing)
                         value = ak.concatenate([value, pad], axis=i + 1)
 
-        self._value = value
-
-        return self
+        return value
 
     @property
     def config(self):
@@ -98,10 +104,15 @@ class NSubjettinessRatio(Observable):
         self.tau_n = TauN(n, physics_object)
 
     def read(self, events):
-        self.tau_m.read(events)
-        self.tau_n.read(events)
-
-        self._value = self.tau_m.value / self.tau_n.value
+        # Both taus come from the same leaf and every jet has a fixed number of
+        # taus, so divide the flat (n_jets, 5) buffer in parallel and restore
+        # the jets per event afterwards
+        taus = self.tau_n._read_taus(events)
+        flat_taus = ak.to_numpy(ak.flatten(taus))
+        ratio = np.empty(len(flat_taus), flat_taus.dtype)
+        divide_taus(flat_taus, self.m - 1, self.n - 1, ratio)
+        ratio = ak.unflatten(ratio, ak.num(taus, 1))
+        self._value = self.tau_n._pad(ratio)
 
         return self
 
@@ -136,3 +147,23 @@ class TauMN(NSubjettinessRatio):
 
 
 TauMN.with_aliases("tau_mn")
+
+
+@nb.njit(parallel=True, cache=True)
+def divide_taus(taus, m, n, out):  # pragma: no cover
+    """Divide two N-subjettiness columns of all jets.
+
+    Parameters
+    ----------
+    taus: array, shape (n_jets, n_taus)
+        N-subjettiness of each jet.
+    m, n: int
+        Column indices of the numerator and denominator.
+    out: array, shape (n_jets,)
+        Output ratios, NaN where the denominator is 0.
+    """
+    for i in nb.prange(len(taus)):
+        if taus[i, n] != 0:
+            out[i] = taus[i, m] / taus[i, n]
+        else:
+            out[i] = np.nan
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import weakref
+
 import awkward as ak
 
-from ..operations import branch_to_momentum4d, constituents_to_momentum4d
+from ..operations import (
+    empty_lists,
+    get_branch_keys,
+    project_momentum4d,
+    slice_and_pad_nested,
+)
 from ..physics_objects import PhysicsObject, is_collective, is_multiple, is_single
 from ..physics_objects import parse_physics_object as parse_object
 
@@ -18,6 +25,7 @@ class Observable:
     ) -> None:
         self._physics_object = self._init_object(physics_object)
         self._class_name = self._init_class_name(class_name)
+        self._name = self._init_name()
         self._supported_objects = self._init_supported_objects(supported_objects)
         self._validate_physics_object()
 
@@ -42,6 +50,12 @@ class Observable:
     def _init_class_name(self, class_name: str | None) -> str:
         return class_name if class_name else self.__class__.__name__
 
+    def _init_name(self) -> str:
+        if self._physics_object:
+            return f"{self._physics_object.name}.{self._class_name}"
+        else:
+            return self._class_name
+
     def _init_supported_objects(
         self, supported_objects: list[str | PhysicsObject] | None
     ) -> list[PhysicsObject] | None:
@@ -84,9 +98,19 @@ class Observable:
             and self.__class__ == other.__class__
         )
 
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.physics_object))
+
     def __repr__(self) -> str:
         return f"{self.name}: {self.value.type!s}"
 
+    def __getstate__(self) -> dict:
+        # The caches of the value hold weak references, which cannot be pickled
+        state = self.__dict__.copy()
+        state.pop("_regular_cache", None)
+        state.pop("_type_cache", None)
+        return state
+
     @property
     def physics_object(self) -> PhysicsObject | None:
         return self._physics_object
@@ -101,20 +125,27 @@ class Observable:
 
     @property
     def value(self) -> ak.Array:
-        if not hasattr(self, "_value"):
-            self._value = ak.Array([])
+        if (value := getattr(self, "_value", None)) is None:
+            return ak.Array([])
+
+        # Converting walks the whole layout, so keep the regular array next to
+        # the value and skip the conversion until the value is replaced
+        source, regular_value = getattr(self, "_regular_cache", (None, None))
+        if source is not None and source() is value:
+            return regular_value
 
         try:
-            return ak.to_regular(self._value, axis=None)
-        except Exception:
-            return self._value
+            regular_value = ak.to_regular(value, axis=None)
+        except ValueError:
+            # Jagged values cannot be regular and are kept as they are
+            regular_value = value
+
+        self._regular_cache = (weakref.ref(value), regular_value)
+        return regular_value
 
     @property
     def name(self) -> str:
-        if self.physics_object:
-            return f"{self.physics_object.name}.{self.class_name}"
-        else:
-            return self.class_name
+        return self._name
 
     @property
     def config(self) -> dict:
@@ -127,25 +158,57 @@ class Observable:
         if "multiple" in self.supported_objects:
             raise NotImplementedError
 
-        all_keys = {i.lower(): i for i in events.keys(full_paths=False)}
+        all_keys = get_branch_keys(events)
         branch = self.physics_object.branch.lower()
         slices = self.physics_object.slices
 
         if branch is None:
             raise ValueError(f"Branch {self.physics_object.branch} not found")
 
+        # Subclasses only differ in the projection, named after the class, so
+        # the same dispatch serves all of them
+        projection = self.__class__.__name__.lower()
         if is_single(self.physics_object) or is_collective(self.physics_object):
-            if f"{branch}.{self.__class__.__name__.lower()}" in all_keys:
-                key = all_keys[f"{branch}.{self.__class__.__name__.lower()}"]
+            if (key := all_keys.get(f"{branch}.{projection}")) is not None:
                 value = events[key].array()
 
             else:
-                array = branch_to_momentum4d(events, all_keys[branch])
-                value = getattr(array, self.__class__.__name__.lower())
+                value = project_momentum4d(events, all_keys[branch], projection)
 
         else:
-            array = constituents_to_momentum4d(events, all_keys[branch])
-            value = getattr(array, self.__class__.__name__.lower())
+            value = project_momentum4d(
+                events, all_keys[branch], projection, constituents=True
+            )
+
+        # Whole branches need neither slicing nor padding
+        if all(i == slice(None) for i in slices):
+            self._value = value
+            return self
+
+        if len(slices) == 2 and all(
+            i.stop is not None and (i.start or 0) >= 0 and i.step is None
+            for i in slices
+        ):
+            self._value = slice_and_pad_nested(value, *slices)
+            return self
+
+        if len(slices) == 1 and slices[0].stop is not None:
+            start = slices[0].start or 0
+            required_length = slices[0].stop - start
+
+            if start >= 0 and required_length >= 0:
+                # Clipping while padding keeps both in one pass over the lists
+                if ak.any(ak.num(value, 1) - start < required_length):
+                    if start > 0:
+                        value = value[:, start:]
+
+                    value = ak.pad_none(value, required_length, axis=1, clip=True)
+                    self._value = value
+                    return self
+
+                # Every list is long enough, so the slice needs no padding
+                self._value = value[:, slices[0]]
+                return self
 
         if len(slices) == 1:
             value = value[:, slices[0]]
@@ -165,9 +228,7 @@ class Observable:
                 else:
                     n_missing = required_length - ak.num(value, i + 1)
                     if ak.sum(n_missing) > 0:
-                        pad = ak.unflatten(
-                            ak.Array([[]] * ak.sum(n_missing)), n_missing
-                        )
+                        pad = ak.unflatten(empty_lists(ak.sum(n_missing)), n_missing)
                         value = ak.concatenate([value, pad], axis=i + 1)
 
         self._value = value
@@ -176,8 +237,8 @@ class Observable:
 
     @classmethod
     def from_name(cls, name: str, **kwargs) -> "Observable":
-        *parts, class_name = name.split(".")
-        physics_object = ".".join(parts) if len(parts) > 0 else None
+        physics_object, _, class_name = name.rpartition(".")
+        physics_object = physics_object if physics_object else None
 
         if "class_name" in kwargs:
             class_name = kwargs["class_name"]
@@ -191,10 +252,24 @@ class Observable:
 
     @property
     def shape(self) -> str:
-        *parts, _ = str(self.value.type).split(" * ")
+        *parts, _ = self._type_parts()
         return tuple(parts)
 
     @property
     def dtype(self) -> type:
-        *_, dtype = str(self.value.type).split(" * ")
+        *_, dtype = self._type_parts()
         return dtype
+
+    def _type_parts(self) -> list[str]:
+        # Formatting the type walks the whole array type, so keep the parts
+        # until the value is replaced. The value is only referenced weakly to
+        # not keep a replaced array alive.
+        if (value := getattr(self, "_value", None)) is None:
+            return str(self.value.type).split(" * ")
+
+        cached_value, parts = getattr(self, "_type_cache", (None, None))
+        if parts is None or cached_value() is not value:
+            parts = str(self.value.type).split(" * ")
+            self._type_cache = (weakref.ref(value), parts)
+
+        return parts
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ..operations import get_branch_keys
 from ..physics_objects import PhysicsObject
 from .observable import Observable
 
@@ -14,7 +15,7 @@ class Size(Observable):
         super().__init__(physics_object, class_name, supported_objects)
 
     def read(self, events) -> Observable:
-        all_keys = {i.lower(): i for i in events.keys(full_paths=False)}
+        all_keys = get_branch_keys(events)
         branch = self.physics_object.branch.lower()
 
         if f"{branch}_size" in all_keys:
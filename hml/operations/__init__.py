@@ -1,8 +1,10 @@
+from .awkward_ops import empty_lists, slice_and_pad_nested
 from .fastjet_ops import get_jet_algorithm
 from .keras_ops import ops_histogram_fixed_width, ops_unique
 from .uproot_ops import (
     branch_to_momentum4d,
     constituents_to_momentum4d,
     find_eflow_in_refs,
-    take_momentum4d,
+    get_branch_keys,
+    project_momentum4d,
 )
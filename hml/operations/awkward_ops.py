@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import awkward as ak
+import numba as nb
+import numpy as np
+
+
+def empty_lists(n):
+    """Create an array of empty lists without building them in Python.
+
+    It is the columnar equivalent of `ak.Array([[]] * n)`, which allocates n
+    Python lists before converting them.
+
+    Parameters
+    ----------
+    n: int
+        Number of empty lists.
+
+    Return
+    ------
+    array: awkward array
+        Empty lists of type "n * var * unknown".
+    """
+    offsets = ak.index.Index64(np.zeros(n + 1, np.int64))
+    return ak.Array(ak.contents.ListOffsetArray(offsets, ak.contents.EmptyArray()))
+
+
+def slice_and_pad_nested(value, outer_slice, inner_slice):
+    """Slice a doubly jagged array on both axes and pad it to a regular one.
+
+    It is the same as slicing `value[:, outer_slice, inner_slice]` and padding
+    both axes to the slice lengths with None, but copies the numbers in a
+    single compiled pass instead of slicing and concatenating lists.
+
+    Parameters
+    ----------
+    value: awkward array
+        Numbers of type "n * var * var * number".
+    outer_slice, inner_slice: slice
+        Slices with a non-negative start, a stop and no step.
+
+    Return
+    ------
+    array: awkward array
+        Padded numbers of type "n * n_outer * n_inner * ?number", or without
+        the option type when nothing is padded.
+    """
+    start0, stop0 = outer_slice.start or 0, outer_slice.stop
+    start1, stop1 = inner_slice.start or 0, inner_slice.stop
+    n_outer, n_inner = max(stop0 - start0, 0), max(stop1 - start1, 0)
+
+    outer_offsets = np.append(0, np.cumsum(ak.to_numpy(ak.num(value, 1))))
+    inner_counts = ak.to_numpy(ak.num(ak.flatten(value, 1), 1))
+    inner_offsets = np.append(0, np.cumsum(inner_counts))
+    content = ak.to_numpy(ak.flatten(value, None))
+
+    out = np.zeros((len(value), n_outer, n_inner), content.dtype)
+    mask = np.zeros((len(value), n_outer, n_inner), np.bool_)
+    fill_nested(outer_offsets, inner_offsets, content, start0, start1, out, mask)
+
+    if mask.all():
+        return ak.Array(out)
+
+    # Wrap the buffers as layouts directly, ak.mask would broadcast the mask
+    content = ak.contents.ByteMaskedArray(
+        ak.index.Index8(mask.reshape(-1).view(np.int8)),
+        ak.contents.NumpyArray(out.reshape(-1)),
+        valid_when=True,
+    )
+    content = ak.contents.RegularArray(content, n_inner)
+    return ak.Array(ak.contents.RegularArray(content, n_outer))
+
+
+@nb.njit(cache=True)
+def fill_nested(
+    outer_offsets, inner_offsets, content, start0, start1, out, mask
+):  # pragma: no cover
+    """Copy the sliced numbers of a doubly jagged array into a regular one.
+
+    Parameters
+    ----------
+    outer_offsets: array, shape (n_events + 1,)
+        Offsets of the outer lists in the inner lists.
+    inner_offsets: array, shape (n_outer_lists + 1,)
+        Offsets of the inner lists in the content.
+    content: array, shape (n_numbers,)
+        Flat numbers.
+    start0, start1: int
+        Non-negative starts of the outer and inner slices.
+    out: array, shape (n_events, n_outer, n_inner)
+        Output numbers.
+    mask: array, shape (n_events, n_outer, n_inner)
+        Whether each output number exists, False for padding.
+    """
+    for i in range(out.shape[0]):
+        for j in range(out.shape[1]):
+            k = outer_offsets[i] + start0 + j
+            if k >= outer_offsets[i + 1]:
+                break
+            for m in range(out.shape[2]):
+                index = inner_offsets[k] + start1 + m
+                if index >= inner_offsets[k + 1]:
+                    break
+                out[i, j, m] = content[index]
+                mask[i, j, m] = True
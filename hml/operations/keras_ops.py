@@ -1,32 +1,40 @@
 from __future__ import annotations
 
 from keras import ops
+from keras.config import epsilon
 
 
 def ops_histogram_fixed_width(values, value_range, nbins, dtype="int32"):
     value_min, value_max = value_range
-    bin_edges = ops.linspace(value_min, value_max, nbins + 1)
-    lower = bin_edges[:-1]  # type: ignore
-    upper = bin_edges[1:]  # type: ignore
-
-    return ops.fori_loop(
-        0,
-        nbins,
-        lambda i, s: ops.scatter_update(
-            s,
-            [[i]],
-            [
-                ops.count_nonzero(
-                    ops.where(
-                        ops.logical_and(lower[i] <= values, values <= upper[i]),
-                        1.0,
-                        0.0,
-                    )
-                )
-            ],
-        ),
-        ops.zeros((nbins,), dtype=dtype),
+    values = ops.convert_to_tensor(values)
+    width = value_max - value_min
+
+    # Values of shape (N, F) are counted per column against ranges of shape
+    # (F,), giving (F, nbins) histograms from the same single pass
+    is_1d = ops.ndim(values) == 1
+    if is_1d:
+        values = ops.expand_dims(values, -1)
+    n_columns = ops.shape(values)[1]
+
+    # Scale values to bin indices and count them in a single pass. The right
+    # edge belongs to the last bin and out-of-range values go to an overflow
+    # bin that is dropped.
+    scale = nbins / ops.maximum(width, epsilon())
+    indices = ops.cast(ops.floor((values - value_min) * scale), "int32")
+    indices = ops.minimum(indices, nbins - 1)
+    in_range = ops.logical_and(value_min <= values, values <= value_max)
+    indices = ops.where(in_range, indices, nbins)
+
+    # Offset each column into its own block of nbins + 1 bins
+    indices = indices + ops.arange(n_columns, dtype="int32") * (nbins + 1)
+    counts = ops.bincount(
+        ops.reshape(indices, (-1,)), minlength=n_columns * (nbins + 1)
     )
+    counts = ops.reshape(counts, (n_columns, nbins + 1))[:, :nbins]  # type: ignore
+    if is_1d:
+        counts = counts[0]
+
+    return ops.cast(counts, dtype)
 
 
 def ops_unique(tensor):
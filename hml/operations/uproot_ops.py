@@ -1,92 +1,120 @@
 from __future__ import annotations
 
+import weakref
+
 import awkward as ak
 import numba as nb
+import numpy as np
 import vector
 
 vector.register_awkward()
 
+_TREE_CACHES = {}
 
-@nb.njit(cache=True)
-def find_eflow_in_refs(eflow, refs):  # pragma: no cover
-    """Find the constituent reference indices in an eflow branch.
 
-    This operation is used to retrieve the jet constituents. Jet constituents are
-    a reference to the "EFlowTrack", "EFlowPhoton", and "EFlowNeutralHadron" branches
-    in the Delphes output.
+def get_tree_cache(events):
+    """Get the cache of values derived from a tree.
 
-    The reference is a 2d record array with the shape (n, var, var), which means
-    n events with variable-length jets and variable-length constituents per jet.
-    The corresponding branch, however, is a 1d record array. To related the two,
-    we need to find the "fUniqueID" of the jet constituents in the reference array.
+    The cache lives as long as the tree, so that observables reading the same
+    events share what has been built once, e.g. the branch keys or 4-momenta.
 
     Parameters
     ----------
-    eflow: awkward array, shape (n, var)
-        EFlowTrack, EFlowPhoton, or EFlowNeutralHadron array.
-    refs: awkward array, shape (n, var, var)
-        Reference array of all jet constituents.
+    events:
+        Events opened by uproot.
 
     Return
     ------
-    indices: list
-        List of indices of constituents in the eflow array.
+    cache: dict
+        Derived values of the tree.
     """
-    indices = []
+    key = id(events)
+    if key not in _TREE_CACHES:
+        _TREE_CACHES[key] = {}
+        weakref.finalize(events, _TREE_CACHES.pop, key, None)
 
-    for record_a, record_b in zip(eflow, refs):
-        indices_per_a = []
+    return _TREE_CACHES[key]
 
-        for i in range(len(record_b)):
-            indices_per_b = []
 
-            for j in range(len(record_b[i])):
-                for k in range(len(record_a)):
-                    if record_b[i][j] == record_a[k]:
-                        indices_per_b.append(k)
-            indices_per_a.append(indices_per_b)
+def get_branch_keys(events):
+    """Map the lowercase names of all branches to their full paths.
 
-        indices.append(indices_per_a)
+    Looking up a branch by its name makes uproot search the whole branch tree,
+    while a full path, e.g. "Jet/Jet.PT", is found directly. The map is built
+    once per tree and shared by every observable reading from it.
 
-    return indices
+    Parameters
+    ----------
+    events:
+        Events opened by uproot.
 
+    Return
+    ------
+    keys: dict
+        Full paths keyed by lowercase branch names, e.g. {"jet.pt": "Jet/Jet.PT"}.
+    """
+    cache = get_tree_cache(events)
+    if "keys" not in cache:
+        names = events.keys(full_paths=False)
+        paths = events.keys(full_paths=True)
+        cache["keys"] = {i.lower(): j for i, j in zip(names, paths)}
+
+    return cache["keys"]
+
+
+@nb.njit(parallel=True, cache=True)
+def find_eflow_in_refs(
+    eflow_ids, eflow_offsets, ref_ids, ref_offsets, jet_offsets
+):  # pragma: no cover
+    """Find the constituent references in an eflow branch.
+
+    This operation is used to retrieve the jet constituents. Jet constituents are
+    a reference to the "EFlowTrack", "EFlowPhoton", and "EFlowNeutralHadron" branches
+    in the Delphes output.
 
-@nb.njit(cache=True)
-def take_momentum4d(array, indices):  # pragma: no cover
-    """Take the 4-momentum of the constituents in the eflow array.
+    The references are a 2d array with the shape (n, var, var), which means n
+    events with variable-length jets and variable-length constituents per jet,
+    while the eflow branch is a 1d array with the shape (n, var). Both are passed
+    flattened with their offsets, and the events are matched in parallel by
+    searching the "fUniqueID" of each reference in the sorted eflow IDs of its
+    event.
 
     Parameters
     ----------
-    array: awkward array, shape (n, var)
-        EFlowTrack, EFlowPhoton, or EFlowNeutralHadron array.
-    indices: list
-        List of indices of constituents in the eflow array.
+    eflow_ids: array, shape (n_eflow,)
+        Flattened "fUniqueID" of the EFlowTrack, EFlowPhoton, or
+        EFlowNeutralHadron array.
+    eflow_offsets: array, shape (n + 1,)
+        Offsets of the eflow objects of each event.
+    ref_ids: array, shape (n_refs,)
+        Flattened "fUniqueID" of all jet constituents.
+    ref_offsets: array, shape (n_jets + 1,)
+        Offsets of the constituents of each jet.
+    jet_offsets: array, shape (n + 1,)
+        Offsets of the jets of each event.
 
     Return
     ------
-    momentum4d: tuple
-        Tuple of 4-momentum components (pt, eta, phi, mass).
+    indices: array, shape (n_refs,)
+        Index of each constituent in the flattened eflow array, or -1 if it is
+        not in this eflow branch.
     """
-    pt = []
-    eta = []
-    phi = []
-    mass = []
-
-    for record, indices_at_1 in zip(array, indices):
-        pt.append(
-            [[record[i].pt for i in indices_at_2] for indices_at_2 in indices_at_1]
-        )
-        phi.append(
-            [[record[i].phi for i in indices_at_2] for indices_at_2 in indices_at_1]
-        )
-        eta.append(
-            [[record[i].eta for i in indices_at_2] for indices_at_2 in indices_at_1]
-        )
-        mass.append(
-            [[record[i].mass for i in indices_at_2] for indices_at_2 in indices_at_1]
-        )
+    indices = np.full(len(ref_ids), -1, np.int64)
 
-    return pt, eta, phi, mass
+    for event in nb.prange(len(jet_offsets) - 1):
+        eflow_start = eflow_offsets[event]
+        eflow_stop = eflow_offsets[event + 1]
+        order = np.argsort(eflow_ids[eflow_start:eflow_stop])
+        sorted_ids = eflow_ids[eflow_start:eflow_stop][order]
+
+        ref_start = ref_offsets[jet_offsets[event]]
+        ref_stop = ref_offsets[jet_offsets[event + 1]]
+        for i in range(ref_start, ref_stop):
+            k = np.searchsorted(sorted_ids, ref_ids[i])
+            if k < len(sorted_ids) and sorted_ids[k] == ref_ids[i]:
+                indices[i] = eflow_start + order[k]
+
+    return indices
 
 
 def branch_to_momentum4d(events, branch, with_id=False):
@@ -95,6 +123,8 @@ def branch_to_momentum4d(events, branch, with_id=False):
     Some branches in the Delphes output do not have full 4-momentum information,
     e.g., "Jet" has PT, Eta, Phi, Mass but no Px, Py, Pz, E. This function converts
     the branch to the registered "Momentum4D" array supported by the vector library.
+    The array is built once per tree, and all observables of the branch are then
+    projected from it.
 
     Parameters
     ----------
@@ -111,20 +141,26 @@ def branch_to_momentum4d(events, branch, with_id=False):
     momenta: Momentum4D
         4-momentum array with the shape (n, var).
     """
-    eta = events[f"{branch}.Eta"].array()
-    phi = events[f"{branch}.Phi"].array()
-
-    if f"{branch}.PT" in events:
-        pt = events[f"{branch}.PT"].array()
-    elif f"{branch}.ET" in events:
-        pt = events[f"{branch}.ET"].array()
-    elif f"{branch}.MET" in events:
-        pt = events[f"{branch}.MET"].array()
+    cache = get_tree_cache(events)
+    if ("momentum4d", branch, with_id) in cache:
+        return cache[("momentum4d", branch, with_id)]
+
+    keys = get_branch_keys(events)
+    prefix = branch.lower()
+    eta = events[keys[f"{prefix}.eta"]].array()
+    phi = events[keys[f"{prefix}.phi"]].array()
+
+    if f"{prefix}.pt" in keys:
+        pt = events[keys[f"{prefix}.pt"]].array()
+    elif f"{prefix}.et" in keys:
+        pt = events[keys[f"{prefix}.et"]].array()
+    elif f"{prefix}.met" in keys:
+        pt = events[keys[f"{prefix}.met"]].array()
     else:
         raise ValueError(f"Cannot find the PT branch for {branch}")
 
-    if f"{branch}.Mass" in events:
-        mass = events[f"{branch}.Mass"].array()
+    if f"{prefix}.mass" in keys:
+        mass = events[keys[f"{prefix}.mass"]].array()
     else:
         mass = ak.zeros_like(eta)
 
@@ -140,14 +176,18 @@ def branch_to_momentum4d(events, branch, with_id=False):
     momenta = ak.values_astype(momenta, "float32")
 
     if with_id:
-        momenta["id"] = events[f"{branch}.fUniqueID"].array()
+        momenta["id"] = events[keys[f"{prefix}.funiqueid"]].array()
 
+    cache[("momentum4d", branch, with_id)] = momenta
     return momenta
 
 
 def constituents_to_momentum4d(events, branch):
     """Convert the constituents in a Delphes branch to a 4-momentum array.
 
+    Matching the constituents to the eflow branches is expensive, so the array is
+    built once per tree and shared by all observables of the constituents.
+
     Parameters
     ----------
     events:
@@ -160,28 +200,86 @@ def constituents_to_momentum4d(events, branch):
     constituents: Momentum4D
         4-momentum array with the shape (n, var, var).
     """
+    cache = get_tree_cache(events)
+    if ("constituents", branch) in cache:
+        return cache[("constituents", branch)]
+
     refs = events[branch].array()["refs"]
     tracks = branch_to_momentum4d(events, "EFlowTrack", with_id=True)
     photons = branch_to_momentum4d(events, "EFlowPhoton", with_id=True)
     neutrals = branch_to_momentum4d(events, "EFlowNeutralHadron", with_id=True)
 
+    n_jets = ak.num(refs, 1)
+    n_refs = ak.flatten(ak.num(refs, 2))
+    ref_ids = ak.to_numpy(ak.flatten(refs, axis=None)).astype(np.int64)
+    ref_offsets = np.append(0, np.cumsum(n_refs))
+    jet_offsets = np.append(0, np.cumsum(n_jets))
+
     matches = []
     for i in [tracks, photons, neutrals]:
-        indices = ak.from_iter(find_eflow_in_refs(i.id, refs))
-        pt, eta, phi, mass = take_momentum4d(i, indices)
-        matches.append(
-            ak.zip(
-                {
-                    "pt": pt,
-                    "eta": eta,
-                    "phi": phi,
-                    "mass": mass,
-                },
-                with_name="Momentum4D",
-            )
+        eflow_ids = ak.to_numpy(ak.flatten(i.id)).astype(np.int64)
+        eflow_offsets = np.append(0, np.cumsum(ak.num(i, 1)))
+        indices = find_eflow_in_refs(
+            eflow_ids, eflow_offsets, ref_ids, ref_offsets, jet_offsets
         )
 
+        # Keep the matched constituents in the order of the references and
+        # count them per jet to restore the (n, var, var) structure
+        is_matched = indices >= 0
+        n_matched = np.append(0, np.cumsum(is_matched))
+        n_matched = n_matched[ref_offsets[1:]] - n_matched[ref_offsets[:-1]]
+
+        matched = ak.flatten(i)[indices[is_matched]]
+        matched = ak.zip(
+            {
+                "pt": matched.pt,
+                "eta": matched.eta,
+                "phi": matched.phi,
+                "mass": matched.mass,
+            },
+            with_name="Momentum4D",
+        )
+        matches.append(ak.unflatten(ak.unflatten(matched, n_matched), n_jets))
+
     constituents = ak.concatenate(matches, -1)
     constituents = ak.values_astype(constituents, "float32")
 
+    cache[("constituents", branch)] = constituents
     return constituents
+
+
+def project_momentum4d(events, branch, projection, constituents=False):
+    """Project the 4-momenta of a Delphes branch to one of their components.
+
+    Observables of different objects in the same branch, e.g., "jet0.px" and
+    "jet1.px", need the same projection, so it is computed once per tree.
+
+    Parameters
+    ----------
+    events:
+        Events opened by uproot.
+    branch: str
+        Branch name to be converted, e.g., "Jet" or "Jet.Constituents".
+    projection: str
+        Attribute of the "Momentum4D" array, e.g., "px" or "eta".
+    constituents: bool
+        Whether the branch refers to jet constituents.
+
+    Return
+    ------
+    values: awkward array
+        Projected values with the shape (n, var), or (n, var, var) for the
+        constituents.
+    """
+    cache = get_tree_cache(events)
+    if ("projection", branch, projection) in cache:
+        return cache[("projection", branch, projection)]
+
+    if constituents:
+        momenta = constituents_to_momentum4d(events, branch)
+    else:
+        momenta = branch_to_momentum4d(events, branch)
+
+    values = getattr(momenta, projection)
+    cache[("projection", branch, projection)] = values
+    return values
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from .collective import Collective, is_collective
-from .multiple import Multiple, is_multiple
+from .multiple import _KINDS, Multiple, is_multiple
 from .nested import Nested, is_nested
 from .physics_object import PhysicsObject
 from .single import Single, is_single
@@ -10,22 +13,25 @@ ALL_OBJECTS = {Single, Collective, Nested, Multiple}
 ALL_OBJECTS_DICT = {cls.__name__: cls for cls in ALL_OBJECTS}
 ALL_OBJECTS_DICT.update({cls.__name__.lower(): cls for cls in ALL_OBJECTS})
 
+# The patterns of is_single, is_collective and is_nested in one alternation,
+# so a name is matched once and its kind read from the group that matched
+_KIND_PATTERN = re.compile(
+    r"^(?:(?P<single>[a-zA-Z]+\d+)"
+    r"|(?P<collective>[a-zA-Z]+(?:\d*:\d*)?)"
+    r"|(?P<nested>[a-zA-Z]+\d*:?\d*\.[a-zA-Z]+\d*:?\d*))$"
+)
+
 
 def get(identifier: str) -> PhysicsObject | None:
     """Retrieve a physics object class from its identifier"""
     return ALL_OBJECTS_DICT.get(identifier)
 
 
+@lru_cache(maxsize=1024)
 def parse_physics_object(name: str) -> PhysicsObject:
     """Parse a name to create a physics object"""
-    if is_single(name):
-        return Single.from_name(name)
-
-    elif is_collective(name):
-        return Collective.from_name(name)
-
-    elif is_nested(name):
-        return Nested.from_name(name)
+    if match_ := _KIND_PATTERN.match(name):
+        return _KINDS[match_.lastgroup].from_name(name)
 
     elif is_multiple(name):
         return Multiple.from_name(name)
@@ -1,38 +1,64 @@
 from __future__ import annotations
 
 import re
+import weakref
+from typing import TYPE_CHECKING, ClassVar
 
 from .physics_object import PhysicsObject
 
+if TYPE_CHECKING:
+    from typing import Self
+
+
+_COLLECTIVE_PATTERN = re.compile(r"^([a-zA-Z]+)(?:(\d*):(\d*))?$")
+
 
 def is_collective(object_: PhysicsObject | str) -> bool:
     """Check if an object is a collective physics object"""
     if isinstance(object_, PhysicsObject):
         return isinstance(object_, Collective)
 
-    return bool(re.match(r"^[a-zA-Z]+$|^[a-zA-Z]+\d*:\d*$", object_))
+    return bool(_COLLECTIVE_PATTERN.match(object_))
 
 
 class Collective(PhysicsObject):
     """A collective physics object"""
 
-    def __init__(
-        self,
+    __slots__ = ("_branch", "_key", "_start", "_stop")
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple, Collective]] = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(
+        cls,
         branch: str,
         start: int | None = None,
         stop: int | None = None,
-    ) -> None:
-        self._branch = branch
-        self._start = start
-        self._stop = stop
+    ) -> Self:
+        key = (cls, branch, start, stop)
+        if (instance := cls._instances.get(key)) is None:
+            instance = super().__new__(cls)
+            instance._branch = branch
+            instance._start = start
+            instance._stop = stop
+            instance._key = key
+            cls._instances[key] = instance
+
+        return instance
+
+    def __getnewargs__(self) -> tuple:
+        return self._branch, self._start, self._stop
+
+    def __reduce__(self) -> tuple:
+        # Slots without __getstate__ only pickle with protocol 2 and above
+        return self.__class__, self.__getnewargs__()
 
     @classmethod
     def from_name(cls, name: str) -> Collective:
-        if re.match(r"^[a-zA-Z]+$|^[a-zA-Z]+\d*:\d*$", name.strip()):
-            match_ = re.match(r"^([a-zA-Z]+)(\d*):?(\d*)$", name)
+        if match_ := _COLLECTIVE_PATTERN.match(name.strip()):
             branch, start, stop = match_.groups()
-            start = int(start) if start != "" else None
-            stop = int(stop) if stop != "" else None
+            start = int(start) if start else None
+            stop = int(stop) if stop else None
 
             return cls(branch, start, stop)
 
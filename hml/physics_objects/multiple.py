@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from .collective import Collective, is_collective
+from functools import lru_cache
+
+from .collective import Collective
 from .nested import Nested
 from .physics_object import PhysicsObject
-from .single import Single, is_single
+from .single import Single
+
+_KINDS = {"single": Single, "collective": Collective, "nested": Nested}
 
 
 def is_multiple(
@@ -11,6 +15,18 @@ def is_multiple(
     supported_types: list[PhysicsObject | str] | None = None,
 ) -> bool:
     """Check if an object is a multiple physics object"""
+    if supported_types is not None:
+        supported_types = tuple(
+            _KINDS.get(i.lower()) if isinstance(i, str) else i.__class__
+            for i in supported_types
+        )
+
+        # Reject unsupported kinds from the separators before parsing any part
+        if isinstance(object_, str) and any(
+            _classify(i) not in supported_types for i in object_.split(",")
+        ):
+            return False
+
     if isinstance(object_, str):
         try:
             object_ = Multiple.from_name(object_)
@@ -20,51 +36,68 @@ def is_multiple(
     if supported_types is None:
         return True
 
-    supported_types = [
-        i.lower() if isinstance(i, str) else i.__class__.__name__.lower()
-        for i in supported_types
-    ]
-
     for obj in object_.all:
-        if obj.__class__.__name__.lower() not in supported_types:
+        if obj.__class__ not in supported_types:
             return False
 
     return True
 
 
+def _classify(name: str) -> type[PhysicsObject]:
+    # The kinds differ by structure, so the name only needs to be scanned for
+    # separators here and is validated once by the from_name of its kind
+    if "." in name:
+        return Nested
+
+    elif ":" not in name and name.rstrip()[-1:].isdigit():
+        return Single
+
+    else:
+        return Collective
+
+
+@lru_cache(maxsize=4096)
+def _parse_parts(name: str) -> tuple[PhysicsObject, ...]:
+    # is_multiple parses a name right before Multiple.from_name does, so keep
+    # the parsed parts, which are never modified, for the second call
+    return tuple(_classify(i).from_name(i) for i in name.split(","))
+
+
 class Multiple(PhysicsObject):
     """A multiple physics object"""
 
-    def __init__(self, all: list[PhysicsObject | str]) -> None:
+    __slots__ = ("_all", "_name")
+
+    def __init__(self, all: list[PhysicsObject | str] | tuple) -> None:
         self._all = self._init_all(all)
+        # Joined once, since the name is compared and formatted repeatedly
+        self._name = ",".join(obj.name for obj in self._all)
 
-    def _init_all(self, objects: list[PhysicsObject | str]) -> list[PhysicsObject]:
+    def __reduce__(self) -> tuple:
+        # Slots without __getstate__ only pickle with protocol 2 and above
+        return self.__class__, (self._all,)
+
+    def _init_all(
+        self, objects: list[PhysicsObject | str]
+    ) -> tuple[PhysicsObject, ...]:
         output = []
         for obj in objects:
             if isinstance(obj, PhysicsObject):
                 output.append(obj)
-
-            elif is_single(obj):
-                output.append(Single.from_name(obj))
-
-            elif is_collective(obj):
-                output.append(Collective.from_name(obj))
-
             else:
-                output.append(Nested.from_name(obj))
+                output.append(_classify(obj).from_name(obj))
 
-        return output
+        return tuple(output)
 
     @classmethod
     def from_name(cls, name: str) -> Multiple:
         if "," in name:
-            all_ = name.split(",")
-            return cls(all_)
+            return cls(_parse_parts(name))
 
         raise ValueError(f"Invalid name '{name}' for a multiple physics object")
 
     @property
-    def all(self) -> list[PhysicsObject]:
+    def all(self) -> tuple[PhysicsObject, ...]:
         return self._all
 
     @property
@@ -77,7 +110,7 @@ class Multiple(PhysicsObject):
 
     @property
     def name(self) -> str:
-        return ",".join(obj.name for obj in self.all)
+        return self._name
 
     @property
     def config(self) -> dict:
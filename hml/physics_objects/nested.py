@@ -1,32 +1,65 @@
 from __future__ import annotations
 
 import re
+import weakref
+from typing import TYPE_CHECKING, ClassVar
 
 from .collective import Collective
 from .physics_object import PhysicsObject
 from .single import Single, is_single
 
+if TYPE_CHECKING:
+    from typing import Self
+
+
+_NESTED_PATTERN = re.compile(r"^[a-zA-Z]+\d*:?\d*\.[a-zA-Z]+\d*:?\d*$")
+
 
 def is_nested(object_: PhysicsObject | str) -> bool:
     """Check if an object is a nested physics object"""
     if isinstance(object_, PhysicsObject):
         return isinstance(object_, Nested)
 
-    return bool(re.match(r"^[a-zA-Z]+\d*:?\d*\.[a-zA-Z]+\d*:?\d*$", object_))
+    return bool(_NESTED_PATTERN.match(object_))
 
 
 class Nested(PhysicsObject):
     """A nested physics object"""
 
-    def __init__(
-        self,
+    __slots__ = ("_key", "_main", "_name", "_sub")
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple, Nested]] = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(
+        cls,
         main: PhysicsObject | str,
         sub: PhysicsObject | str,
-    ) -> None:
-        self._main = self._init_object(main)
-        self._sub = self._init_object(sub)
-
-    def _init_object(self, object_: PhysicsObject | str) -> PhysicsObject:
+    ) -> Self:
+        main = cls._init_object(main)
+        sub = cls._init_object(sub)
+
+        # Both parts are interned themselves, so their keys identify them
+        key = (cls, main._key, sub._key)
+        if (instance := cls._instances.get(key)) is None:
+            instance = super().__new__(cls)
+            instance._main = main
+            instance._sub = sub
+            instance._name = f"{main.name}.{sub.name}"
+            instance._key = key
+            cls._instances[key] = instance
+
+        return instance
+
+    def __getnewargs__(self) -> tuple:
+        return self._main, self._sub
+
+    def __reduce__(self) -> tuple:
+        # Slots without __getstate__ only pickle with protocol 2 and above
+        return self.__class__, self.__getnewargs__()
+
+    @staticmethod
+    def _init_object(object_: PhysicsObject | str) -> PhysicsObject:
         if isinstance(object_, PhysicsObject):
             return object_
 
@@ -38,8 +71,8 @@ class Nested(PhysicsObject):
 
     @classmethod
     def from_name(cls, name: str) -> Nested:
-        if "." in name:
-            main, sub = name.split(".")
+        main, sep, sub = name.partition(".")
+        if sep:
             return cls(main, sub)
 
         raise ValueError(f"Invalid name '{name}' for a nested physics object")
@@ -62,7 +95,7 @@ class Nested(PhysicsObject):
 
     @property
     def name(self) -> str:
-        return f"{self.main.name}.{self.sub.name}"
+        return self._name
 
     @property
     def config(self) -> dict:
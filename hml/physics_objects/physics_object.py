@@ -4,11 +4,22 @@ from abc import ABC, abstractmethod
 
 
 class PhysicsObject(ABC):
-    def __eq__(self, other: PhysicsObject | str) -> bool:
+    # Interned subclasses are only referenced weakly by their registries
+    __slots__ = ("__weakref__",)
+
+    def __eq__(self, other: PhysicsObject) -> bool:
+        if other is self:
+            return True
+
+        # Names compare case-insensitively, which no hash of a string can
+        # follow, so objects are only equal to other objects
         if isinstance(other, PhysicsObject):
             return self.name.lower() == other.name.lower()
 
-        return self.name.lower() == other.lower()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.name.lower())
 
     def __str__(self) -> str:
         return self.name
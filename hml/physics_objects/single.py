@@ -1,28 +1,56 @@
 from __future__ import annotations
 
 import re
+import weakref
+from typing import TYPE_CHECKING, ClassVar
 
 from .physics_object import PhysicsObject
 
+if TYPE_CHECKING:
+    from typing import Self
+
+
+_SINGLE_PATTERN = re.compile(r"^([a-zA-Z]+)(\d+)$")
+
 
 def is_single(object_: PhysicsObject | str) -> bool:
     """Check if an object is a single physics object"""
     if isinstance(object_, PhysicsObject):
         return isinstance(object_, Single)
 
-    return bool(re.match(r"^[a-zA-Z]+\d+$", object_))
+    return bool(_SINGLE_PATTERN.match(object_))
 
 
 class Single(PhysicsObject):
     """A single physics object"""
 
-    def __init__(self, branch: str, index: int) -> None:
-        self._branch = branch
-        self._index = index
+    __slots__ = ("_branch", "_index", "_key", "_name")
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple, Single]] = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(cls, branch: str, index: int) -> Self:
+        key = (cls, branch, index)
+        if (instance := cls._instances.get(key)) is None:
+            instance = super().__new__(cls)
+            instance._branch = branch
+            instance._index = index
+            instance._name = f"{branch}{index}"
+            instance._key = key
+            cls._instances[key] = instance
+
+        return instance
+
+    def __getnewargs__(self) -> tuple:
+        return self._branch, self._index
+
+    def __reduce__(self) -> tuple:
+        # Slots without __getstate__ only pickle with protocol 2 and above
+        return self.__class__, self.__getnewargs__()
 
     @classmethod
     def from_name(cls, name: str) -> Single:
-        if match_ := re.match(r"^([a-zA-Z]+)(\d+)$", name.strip()):
+        if match_ := _SINGLE_PATTERN.match(name.strip()):
             branch, index = match_.groups()
             return cls(branch, int(index))
 
@@ -42,7 +70,7 @@ class Single(PhysicsObject):
 
     @property
     def name(self) -> str:
-        return f"{self.branch}{self.index}"
+        return self._name
 
     @property
     def config(self) -> dict:
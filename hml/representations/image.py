@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from importlib import import_module
-
 import awkward as ak
 import matplotlib.pyplot as plt
 import numba as nb
@@ -9,7 +7,7 @@ import numpy as np
 import vector
 from fastjet import ClusterSequence, JetDefinition
 
-from hml.observables import parse_observable
+from hml.observables import Observable, parse_observable
 from hml.operations import get_jet_algorithm
 
 vector.register_awkward()
@@ -391,19 +389,17 @@ class Image:
 
     @classmethod
     def from_config(cls, config):
-        module = import_module("hml.observables")
-
         height_class_name = config["height_config"]["class_name"]
-        height_class = getattr(module, height_class_name)
+        height_class = Observable.aliases[height_class_name]
         height = height_class.from_config(config["height_config"]["config"])
 
         width_class_name = config["width_config"]["class_name"]
-        width_class = getattr(module, width_class_name)
+        width_class = Observable.aliases[width_class_name]
         width = width_class.from_config(config["width_config"]["config"])
 
         if config["channel_config"] is not None:
             channel_class_name = config["channel_config"]["class_name"]
-            channel_class = getattr(module, channel_class_name)
+            channel_class = Observable.aliases[channel_class_name]
             channel = channel_class.from_config(config["channel_config"]["config"])
         else:
             channel = None
@@ -422,7 +418,7 @@ class Image:
         return instance
 
 
-@nb.njit
+@nb.njit(cache=True)
 def histogram2d_numba_weighted(x, y, bins, xrange, yrange, weights):
     hist = np.zeros((bins[0], bins[1]), dtype=np.float64)
 
@@ -443,7 +439,7 @@ def histogram2d_numba_weighted(x, y, bins, xrange, yrange, weights):
     return hist
 
 
-@nb.njit
+@nb.njit(cache=True)
 def histogram2d_numba(x, y, bins, xrange, yrange):
     """
     A simplified version of numpy.histogram2d compatible with Numba.
@@ -476,7 +472,7 @@ def histogram2d_numba(x, y, bins, xrange, yrange):
     return hist
 
 
-@nb.njit
+@nb.njit(cache=True)
 def calculate_histograms(widths, heights, w_bins, h_bins, total, weights=None):
     # Assuming widths and heights are flat NumPy arrays of the same length
     # and that missing data has been handled prior to this call.
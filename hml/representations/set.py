@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from importlib import import_module
-
 import awkward as ak
+import numpy as np
 
 from hml.observables import Observable, parse_observable
 
@@ -51,9 +50,14 @@ class Set:
                 if obs.shape[1] == "1" and obs.shape[2] == "1":
                     value = obs.value[:, :, 0]
 
-            values.append(value)
+            values.append(ak.to_numpy(value))
 
-        self._values = ak.concatenate(values, axis=1)
+        # Stack the columns in numpy, which fills one buffer instead of
+        # broadcasting the awkward arrays against each other
+        if any(isinstance(i, np.ma.MaskedArray) for i in values):
+            self._values = ak.Array(np.ma.hstack(values))
+        else:
+            self._values = ak.Array(np.hstack(values))
 
         return self
 
@@ -82,10 +86,7 @@ class Set:
         observables = []
 
         for i_config in config["observable_configs"].values():
-            class_type = Observable.aliases[i_config["class_name"]]
-            class_name = class_type.__name__
-            module = import_module(class_type.__module__)
-            class_ = getattr(module, class_name)
+            class_ = Observable.aliases[i_config["class_name"]]
             class_config = i_config["config"]
             observables.append(class_.from_config(class_config))
 
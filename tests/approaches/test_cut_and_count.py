@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from hml.approaches import CutAndCount
+from hml.approaches.cuts.cut_and_count import find_best_cuts, find_best_pair
+
+
+def select(x, lower, upper, case):
+    return [
+        x <= lower,
+        x >= lower,
+        (x >= lower) & (x <= upper),
+        (x <= lower) | (x >= upper),
+    ][case]
+
+
+def brute_force(candidates, x0, x1):
+    # Scan all pairs in order and keep the first with the fewest errors
+    best_errors, best = len(x0) + len(x1) + 1, None
+    for upper in range(1, len(candidates)):
+        for lower in range(upper):
+            for case in range(4):
+                selected0 = select(x0, candidates[lower], candidates[upper], case)
+                selected1 = select(x1, candidates[lower], candidates[upper], case)
+                errors = selected0.sum() + (~selected1).sum()
+                if errors < best_errors:
+                    best_errors, best = errors, (lower, upper, case)
+
+    return best
+
+
+def count_sides(x, candidates):
+    n_left = (x[None, :] <= candidates[:, None]).sum(1)
+    n_right = (x[None, :] >= candidates[:, None]).sum(1)
+    return n_left, n_right
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_find_best_pair(seed):
+    rng = np.random.default_rng(seed)
+    # Few distinct values, so samples sit on the cuts and pairs tie
+    x0 = rng.integers(0, 8, rng.integers(1, 30)).astype(np.float64)
+    x1 = rng.integers(0, 8, rng.integers(1, 30)).astype(np.float64)
+    candidates = np.unique(rng.integers(0, 8, rng.integers(2, 8))).astype(np.float64)
+    if len(candidates) < 2:
+        candidates = np.array([0.0, 7.0])
+
+    bkg_left, bkg_right = count_sides(x0, candidates)
+    sig_left, sig_right = count_sides(x1, candidates)
+    best = find_best_pair(bkg_left, bkg_right, sig_left, sig_right, len(x0), len(x1))
+
+    assert best == brute_force(candidates, x0, x1)
+
+
+def test_find_best_pair_ties():
+    # Every pair and case misclassifies the same samples, so the first wins
+    x = np.array([1.0, 2.0])
+    candidates = np.array([5.0, 6.0, 7.0])
+    n_left, n_right = count_sides(x, candidates)
+    best = find_best_pair(n_left, n_right, n_left, n_right, 2, 2)
+
+    assert best == brute_force(candidates, x, x) == (0, 1, 0)
+
+
+@pytest.mark.parametrize("n_candidates", [0, 1, 3])
+def test_find_best_cuts(n_candidates):
+    rng = np.random.default_rng(n_candidates)
+    x0 = np.sort(rng.normal(-1, 1, (1, 50)))
+    x1 = np.sort(rng.normal(1, 1, (1, 50)))
+    x_max = np.maximum(x0.max(1), x1.max(1))
+    bin_edges = np.linspace(-4, 4, 11)[None, :]
+    is_candidate = np.zeros((1, 9), bool)
+    is_candidate[0, [2, 4, 6][:n_candidates]] = True
+
+    lower, upper, case = find_best_cuts(is_candidate, bin_edges, x_max, x0, x1)
+
+    # No candidate falls back to a cut at 0, and a single candidate is paired
+    # with the maximum
+    candidates = bin_edges[0][np.nonzero(is_candidate[0])[0] + 1]
+    if n_candidates == 0:
+        candidates = np.array([0.0])
+    if len(candidates) == 1:
+        candidates = np.append(candidates, x_max[0])
+
+    lower_index, upper_index, expected_case = brute_force(candidates, x0[0], x1[0])
+    assert lower[0] == candidates[lower_index]
+    assert upper[0] == candidates[upper_index]
+    assert case[0] == expected_case
+
+
+@pytest.mark.parametrize("topology", ["parallel", "sequential"])
+def test_fit_and_predict(topology):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(1000, 2)).astype(np.float32)
+    # Both features separate the classes, since parallel cuts are independent
+    x[:, 1] = x[:, 0] + 0.1 * x[:, 1]
+    y = np.eye(2)[(x[:, 0] > 0.5).astype(int)]
+
+    model = CutAndCount(n_observables=2, topology=topology)
+    model.compile(optimizer="adam", loss="crossentropy", metrics=["accuracy"])
+    model.fit(x, y, batch_size=len(x), verbose=0)
+    y_pred = model.predict(x, verbose=0)
+
+    assert y_pred.shape == (1000, 2)
+    assert np.all(y_pred.sum(1) == 1)
+    assert np.mean(y_pred.argmax(1) == y.argmax(1)) > 0.9
+
+    # Predicting applies the fitted cuts of all features
+    selected = np.ones(len(x), bool)
+    for i, layer in enumerate(model.cut_layers):
+        selected &= select(x[:, i], layer.cut_left, layer.cut_right, layer.case)
+    assert np.all(y_pred[:, 1] == selected)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from hml.approaches import HistGradientBoostedDecisionTree
+
+
+def test_fit_and_predict():
+    np.random.seed(0)
+    x = np.random.normal(size=(100, 3))
+    y = (x[:, 0] > 0).astype(int)
+
+    model = HistGradientBoostedDecisionTree(max_iter=5)
+    model.compile(metrics=["accuracy"])
+    history = model.fit(x, y, validation_split=0.2, verbose=0)
+
+    assert list(history.history) == ["loss", "accuracy", "val_loss", "val_accuracy"]
+    for values in history.history.values():
+        assert isinstance(values, list)
+        assert len(values) == model.n_iter_ == 5
+
+    assert model.predict(x).shape == (100, 2)
@@ -96,3 +96,61 @@ def test_launch():
     assert loaded_g.processes == ["p p > w+ z"]
 
     shutil.rmtree("test_pp2wz")
+
+
+def test_processes_from_output(tmp_path):
+    g = Madgraph5.from_output("./tests/data/pp2tt")
+
+    assert g.processes == ["p p > t t~"]
+    assert g.processes is g.processes
+
+    # Escaped header
+    output_dir = tmp_path / "pp2tt"
+    shutil.copytree("./tests/data/pp2tt", output_dir)
+    crossx = output_dir / "crossx.html"
+    crossx.write_text(crossx.read_text().replace("p p > t t~", "p p &gt; t t~"))
+    assert Madgraph5.from_output(output_dir).processes == ["p p > t t~"]
+
+
+def test_launch_reuse_grids(tmp_path):
+    g = Madgraph5.from_output(tmp_path)
+    settings = {"nevents": 100}
+    (tmp_path / ".grid_key").write_text(g._get_grid_key("off", settings, [], []))
+
+    commands = g.launch(settings=settings, reuse_grids=True, dry=True)
+    assert commands.splitlines()[:2] == [
+        f"launch -i {tmp_path}",
+        "generate_events --only_generation",
+    ]
+
+    # Other settings need new grids
+    commands = g.launch(
+        settings={"nevents": 100, "ebeam1": 7000}, reuse_grids=True, dry=True
+    )
+    assert commands.splitlines()[:2] == [f"launch -i {tmp_path}", "generate_events"]
+
+    # Grids are only reused on request, without reading the cards
+    commands = g.launch(settings=settings, cards=["missing_card.dat"], dry=True)
+    assert commands.splitlines()[:2] == [f"launch -i {tmp_path}", "generate_events"]
+
+
+def test_runs_without_events(tmp_path):
+    assert Madgraph5.from_output(tmp_path).runs == []
+
+
+def test_launch_seeded_default_cards(tmp_path):
+    (tmp_path / "Cards").mkdir()
+    (tmp_path / "Cards/pythia8_card_default.dat").write_text("Main:numberOfEvents\n")
+    (tmp_path / "Cards/delphes_card_default.dat").write_text("set MaxEvents -1\n")
+
+    g = Madgraph5.from_output(tmp_path)
+    commands = g.launch(shower="pythia8", detector="delphes", seed=42, dry=True)
+    cards = [Path(i) for i in commands.splitlines() if "_card_" in i]
+
+    # Both seeded copies are passed to Madgraph5
+    assert [i.name.split("_card_")[0] for i in cards] == ["pythia8", "delphes"]
+    assert "Random:seed = 42" in cards[0].read_text()
+    assert "set RandomSeed 42" in cards[1].read_text()
+
+    for card in cards:
+        card.unlink()
@@ -5,6 +5,7 @@ from keras.metrics import FalseNegatives, FalsePositives, TrueNegatives, TruePos
 from keras.ops import convert_to_numpy
 from sklearn.metrics import roc_curve
 
+from hml.metrics import MaxSignificance
 from hml.metrics.max_significance import calculate_thresholds
 
 
@@ -35,3 +36,25 @@ def test_thresholds():
     np.testing.assert_allclose(tpr, hml_tpr)
     np.testing.assert_allclose(fpr, hml_fpr)
     np.testing.assert_allclose(thresholds[1:], keras_thresholds[1:], rtol=1e-5)
+
+
+def test_confusion_matrix():
+    np.random.seed(0)
+    y_true = np.random.choice([0, 1], (20,))
+    y_prob = np.random.uniform(0, 1, (20,)).astype("float32")
+    thresholds = [0.2, 0.5, 0.8]
+
+    metric = MaxSignificance(thresholds=thresholds)
+    metric.update_state(y_true[:10], y_prob[:10])
+    metric.update_state(y_true[10:], y_prob[10:])
+
+    for keras_metric, hml_variable in [
+        (TruePositives(thresholds), metric.true_positives),
+        (FalsePositives(thresholds), metric.false_positives),
+        (TrueNegatives(thresholds), metric.true_negatives),
+        (FalseNegatives(thresholds), metric.false_negatives),
+    ]:
+        np.testing.assert_allclose(
+            convert_to_numpy(hml_variable),
+            convert_to_numpy(keras_metric(y_true, y_prob)),
+        )
@@ -65,3 +65,16 @@ def test_read(events):
 
     obs = kinematics.Px(physics_object="jet0").read(events)
     assert str(obs.value.type) == f"{ak.sum(cut)} * 1 * float32"
+
+
+def test_value(events):
+    # Regular values are converted once and kept apart from the read value
+    obs = kinematics.Pt(physics_object="jet:2").read(events)
+    read_value = obs._value
+    assert obs.value is obs.value
+    assert obs._value is read_value
+    assert str(obs.value.type) == f"{len(obs.value)} * 2 * ?float32"
+
+    # Jagged values are kept as they are
+    obs = kinematics.Pt(physics_object="jet").read(events)
+    assert obs.value is obs._value
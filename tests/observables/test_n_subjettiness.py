@@ -1,7 +1,9 @@
 import awkward as ak
+import numpy as np
 import pytest
 
 from hml.observables import TauMN, TauN
+from hml.observables.n_subjettiness import divide_taus
 
 
 def test_init():
@@ -55,3 +57,12 @@ def test_read(events):
         / TauN(1, physics_object="fatjet0").read(events).value
         == obs.value
     )
+
+
+def test_divide_taus():
+    taus = np.array([[1.0, 2.0, 0.0, 0.0, 0.0], [0.0, 3.0, 0.0, 0.0, 0.0]])
+    out = np.empty(len(taus))
+    divide_taus(taus, 1, 0, out)
+
+    assert out[0] == 2.0
+    assert np.isnan(out[1])
@@ -1,3 +1,6 @@
+import pickle
+
+import dill
 import pytest
 
 from hml.physics_objects.collective import Collective, is_collective
@@ -23,7 +26,7 @@ def test_special_methods():
     obj = Collective(branch="jet", start=1, stop=3)
 
     assert obj == Collective(branch="jet", start=1, stop=3)
-    assert obj == "jet1:3"
+    assert obj == Collective.from_name("Jet1:3")
     assert str(obj) == "jet1:3"
     assert repr(obj) == "Collective(branch='jet', start=1, stop=3)"
 
@@ -49,3 +52,11 @@ def test_is_collective(single_names, collective_names, nested_names):
 
     for case in nested_names:
         assert is_collective(case) is False
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    obj = Collective("jet", 1, 3)
+
+    assert pickle.loads(pickle.dumps(obj, protocol)) is obj
+    assert dill.loads(dill.dumps(obj, protocol)) is obj
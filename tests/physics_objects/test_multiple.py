@@ -1,5 +1,7 @@
+import pickle
 from itertools import combinations, product
 
+import dill
 import pytest
 
 from hml.physics_objects import Collective, Multiple, Nested, Single, is_multiple
@@ -37,7 +39,7 @@ def test_special_methods():
     obj = Multiple(all=["jet0", "jet", "jet0.constituents:3"])
 
     assert obj == Multiple(all=["jet0", "jet", "jet0.constituents:3"])
-    assert obj == "jet0,jet,jet0.constituents:3"
+    assert obj == Multiple.from_name("Jet0,Jet,Jet0.Constituents:3")
     assert str(obj) == "jet0,jet,jet0.constituents:3"
     assert repr(obj) == "Multiple(all=['jet0', 'jet', 'jet0.constituents:3'])"
 
@@ -79,3 +81,15 @@ def test_is_multiple(single_names, collective_names, nested_names, multiple_name
     for case in product(single_names, collective_names):
         assert is_multiple(",".join(case), ["single", "collective"]) is True
         assert is_multiple(",".join(case), ["single", "nested"]) is False
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    obj = Multiple(["jet0", "jet:2", "jet0.constituents"])
+
+    for loaded in [
+        pickle.loads(pickle.dumps(obj, protocol)),
+        dill.loads(dill.dumps(obj, protocol)),
+    ]:
+        assert loaded == obj
+        assert loaded.all == obj.all
@@ -1,3 +1,6 @@
+import pickle
+
+import dill
 import pytest
 
 from hml.physics_objects import Collective, Nested, Single, is_nested
@@ -6,8 +9,8 @@ from hml.physics_objects import Collective, Nested, Single, is_nested
 def test_init():
     obj = Nested(main="jet0", sub="constituents1:3")
 
-    assert obj.main == "jet0"
-    assert obj.sub == "constituents1:3"
+    assert obj.main.name == "jet0"
+    assert obj.sub.name == "constituents1:3"
 
     assert obj.branch == "jet.constituents"
     assert obj.slices == [slice(0, 1), slice(1, 3)]
@@ -26,7 +29,7 @@ def test_special_methods():
     obj = Nested(main="jet0", sub="constituents1:3")
 
     assert obj == Nested(main="jet0", sub="constituents1:3")
-    assert obj == "jet0.constituents1:3"
+    assert obj == Nested.from_name("Jet0.Constituents1:3")
     assert str(obj) == "jet0.constituents1:3"
     assert repr(obj) == "Nested(main='jet0', sub='constituents1:3')"
 
@@ -36,6 +39,7 @@ def test_class_methods():
 
     assert obj == Nested.from_name("jet0.constituents1:3")
     assert obj == Nested.from_config(obj.config)
+    assert obj is Nested.from_name("jet0.constituents1:3")
 
     with pytest.raises(ValueError):
         Nested.from_name("jet0")
@@ -52,3 +56,11 @@ def test_is_nested(single_names, collective_names, nested_names):
 
     for case in collective_names:
         assert is_nested(case) is False
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    obj = Nested("jet0", "constituents:3")
+
+    assert pickle.loads(pickle.dumps(obj, protocol)) is obj
+    assert dill.loads(dill.dumps(obj, protocol)) is obj
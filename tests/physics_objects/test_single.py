@@ -1,3 +1,8 @@
+import gc
+import pickle
+import weakref
+
+import dill
 import pytest
 
 from hml.physics_objects.single import Single, is_single
@@ -17,7 +22,13 @@ def test_special_methods():
     obj = Single(branch="jet", index=0)
 
     assert obj == Single(branch="jet", index=0)
-    assert obj == "jet0"
+    assert obj == Single.from_name("Jet0")
+    assert hash(obj) == hash(Single.from_name("Jet0"))
+    assert {obj: 0}[Single.from_name("Jet0")] == 0
+
+    # Strings are not physics objects, whatever their case
+    assert obj != "jet0"
+    assert "jet0" not in {obj}
     assert str(obj) == "jet0"
     assert repr(obj) == "Single(branch='jet', index=0)"
 
@@ -27,6 +38,7 @@ def test_class_methods():
 
     assert obj == Single.from_name("jet0")
     assert obj == Single.from_config(obj.config)
+    assert obj is Single.from_name("jet0")
 
     with pytest.raises(ValueError):
         Single.from_name("jet")
@@ -43,3 +55,21 @@ def test_is_single(single_names, collective_names, nested_names):
 
     for case in nested_names:
         assert is_single(case) is False
+
+
+def test_interning():
+    assert Single("muon", 7) is Single("muon", 7)
+    assert Single("muon", 7) is Single.from_name("muon7")
+
+    # Unused instances are not kept alive
+    ref = weakref.ref(Single("muon", 8))
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    obj = Single("jet", 0)
+
+    assert pickle.loads(pickle.dumps(obj, protocol)) is obj
+    assert dill.loads(dill.dumps(obj, protocol)) is obj